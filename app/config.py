@@ -14,20 +14,51 @@ class Settings(BaseSettings):
     FIREFLIES_API_BASE_URL: str = "https://api.fireflies.ai"
     # Only API key comes from environment (sensitive)
     FIREFLIES_API_KEY: str
+    # Max concurrent transcript-detail requests (keeps fan-out within Fireflies rate limits)
+    FIREFLIES_MAX_CONCURRENCY: int = 10
+    # Attempts per GraphQL request on 429/5xx or transport errors (jittered exponential backoff)
+    FIREFLIES_MAX_RETRIES: int = 5
+    # In-process response caches (transcript content is immutable once processed)
+    FIREFLIES_DETAIL_CACHE_TTL_SECONDS: int = 3600
+    FIREFLIES_LIST_CACHE_TTL_SECONDS: int = 60
+    # Send queries as Automatic Persisted Queries (hash first, full text only on a server miss)
+    FIREFLIES_APQ_ENABLED: bool = False
     
     # Groq API Configuration
     GROQ_API_KEY: str
+    # Process-wide cap on in-flight Groq calls (size of the thread pool running agent.run)
+    GROQ_MAX_CONCURRENT_CALLS: int = 16
+    # Per-attempt timeout and extra attempts for client-identification LLM calls
+    GROQ_TIMEOUT_SECONDS: float = 45.0
+    GROQ_MAX_RETRIES: int = 2
     
     # Pinecone Configuration
     PINECONE_API_KEY: Optional[str] = None
     PINECONE_INDEX_NAME: Optional[str] = None
     PINECONE_DIMENSION: int = 384  # Default for FastEmbed BAAI/bge-small-en-v1.5
-    PINECONE_METRIC: str = "cosine"  # cosine, dotproduct, euclidean
+    # cosine, dotproduct, euclidean. Embeddings are L2-normalized client-side, so dotproduct ranks
+    # like cosine without per-query server-side normalization. Only affects newly created indexes:
+    # an existing cosine index keeps working; switching it requires a one-time reindex
+    # (create a dotproduct index and re-run the backfill).
+    PINECONE_METRIC: str = "dotproduct"
     PINECONE_CLOUD: str = "aws"  # aws, gcp, azure
     PINECONE_REGION: str = "us-east-1"
     
     # FastEmbed Configuration
     FASTEMBED_MODEL: str = "BAAI/bge-small-en-v1.5"  # Default FastEmbed model
+    # Use an INT8-quantized OpenVINO model for agent embeddings (requires optimum[openvino])
+    FASTEMBED_QUANTIZED: bool = False
+    # Run ingest embeddings on CUDA/CoreML when onnxruntime offers them (CPU remains the fallback)
+    FASTEMBED_GPU: bool = True
+    
+    # Semantic Cache Configuration (answers for near-duplicate agent questions, scoped per session and day)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95  # Minimum cosine similarity for a cache hit
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 1024
+    SEMANTIC_CACHE_TTL_SECONDS: int = 3600  # Cached answers expire so new meetings are picked up
+    
+    # Agent Prompt Configuration
+    HISTORY_TOKEN_BUDGET: int = 2000  # Max (estimated) tokens of conversation history sent per query
     
     # Client Identification Configuration
     # Internal team domains to exclude (comma-separated)
@@ -40,6 +71,17 @@ class Settings(BaseSettings):
     BRAND_ONLY_MIN_CONFIDENCE: float = 0.7
     # If still unassigned after LLM passes, place into an ambiguous bucket using the exact meeting title
     INCLUDE_AMBIGUOUS_BUCKET: bool = True
+    # Max meetings per domain-batch LLM prompt (larger batches are split over several calls)
+    LLM_MAX_MEETINGS_PER_PROMPT: int = 40
+    # Assign meetings whose only external domain is the batch seed (and whose title names no
+    # other party) to that domain locally instead of asking the LLM
+    LLM_AUTO_ASSIGN_SINGLE_DOMAIN: bool = True
+    # Reuse parsed outputs of identical deterministic (temperature=0) LLM requests (in-process)
+    LLM_RESPONSE_CACHE_ENABLED: bool = True
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    # Directory for a persistent (diskcache) response cache shared across restarts and workers.
+    # Unset keeps responses in memory only.
+    LLM_RESPONSE_CACHE_DIR: Optional[str] = None
     
     # Output Configuration
     OUTPUT_DIR: str = "./output"
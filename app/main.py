@@ -10,10 +10,12 @@ from datetime import datetime, timedelta
 import logging
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
+from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.services.fireflies_client import FirefliesClient
 from app.services.data_processor import DataProcessor
+from app.services.llm_client_identifier import close_groq_executor
 from app.services.word_generator import WordGenerator
 from app.services.session_manager import SessionManager
 from app.services.pinecone_client import PineconeClient
@@ -28,10 +30,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Fireflies client (and connection pool) per process, bound to the server's event loop
+    fireflies_client = FirefliesClient()
+    app.state.fireflies = fireflies_client
+    try:
+        yield
+    finally:
+        await fireflies_client.aclose()
+        await close_groq_executor()
+
+
+def get_fireflies(request: Request) -> FirefliesClient:
+    """Dependency returning the process-wide Fireflies client created in lifespan."""
+    return request.app.state.fireflies
+
+
 app = FastAPI(
     title="Fireflies Transcript Processor",
     description="API to fetch, process, and generate Word documents from Fireflies transcripts",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -176,14 +197,13 @@ async def options_handler(full_path: str, request: Request):
 
 
 @app.get("/test-api")
-async def test_api():
+async def test_api(fireflies_client: FirefliesClient = Depends(get_fireflies)):
     """
     Debug endpoint to test Fireflies API and see the raw response structure.
     Use this to understand the API response format.
     """
     try:
         logger.info("Testing Fireflies API connection")
-        fireflies_client = FirefliesClient()
         transcripts = await fireflies_client.get_weekly_transcripts()
         
         return {
@@ -204,7 +224,7 @@ async def test_api():
 
 
 @app.post("/process-transcripts")
-async def process_transcripts():
+async def process_transcripts(fireflies_client: FirefliesClient = Depends(get_fireflies)):
     """
     Main endpoint to process Fireflies transcripts for the past week.
     Called by n8n weekly trigger.
@@ -216,7 +236,6 @@ async def process_transcripts():
         logger.info("Starting transcript processing for past week")
         
         # Initialize services
-        fireflies_client = FirefliesClient()
         data_processor = DataProcessor()
         word_generator = WordGenerator()
         
@@ -278,14 +297,16 @@ async def process_transcripts():
         )
 
 @app.post("/process-transcripts-client", response_model=ClientTranscriptsResponse)
-async def process_transcripts_client(req: ClientTranscriptsRequest):
+async def process_transcripts_client(
+    req: ClientTranscriptsRequest,
+    fireflies_client: FirefliesClient = Depends(get_fireflies)
+):
     """
     Process transcripts for a specific client within a date range.
     Supports domain-based or brand-label client matching.
     """
     try:
         logger.info(f"Processing client '{req.client}' from {req.start_date} to {req.end_date} (use_llm={req.use_llm})")
-        fireflies_client = FirefliesClient()
         data_processor = DataProcessor()
         word_generator = WordGenerator()
 
@@ -688,7 +709,7 @@ async def run_daily_sync_background():
         logger.info("=" * 60)
         
         # Initialize services
-        fireflies_client = FirefliesClient()
+        fireflies_client = app.state.fireflies
         pinecone_client = PineconeClient()
         data_processor = DataProcessor()
         
@@ -696,8 +717,7 @@ async def run_daily_sync_background():
         if not pinecone_client.index:
             if pinecone_client.index_name:
                 try:
-                    existing_indexes = pinecone_client.list_indexes()
-                    if pinecone_client.index_name not in existing_indexes:
+                    if not pinecone_client.index_exists():
                         logger.info(f"Index '{pinecone_client.index_name}' does not exist. Creating...")
                         pinecone_client.create_index()
                     else:
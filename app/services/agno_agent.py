@@ -10,128 +10,46 @@ This service creates an Agno agent that uses:
 Note: This service only connects to existing indexes. Index management
 (create/delete/upsert) is handled separately by PineconeClient.
 """
+import io
 import logging
 import os
 import asyncio
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+import time
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from agno.agent import Agent
 from agno.knowledge.knowledge import Knowledge
 from agno.vectordb.pineconedb import PineconeDb
 from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
 from agno.models.groq import Groq
+from agno.metrics import MessageMetrics
 # from agno.db.postgres import PostgresDb  # Removed - using Supabase REST API instead
 
 from app.config import settings
-from app.services.supabase_client import SupabaseClient
+from app.services.supabase_client import SupabaseClient, get_cached_history, store_history
+from app.services.semantic_cache import SemanticCache
+from app.services.embedders import EmbeddingBatcher, create_embedder
 
 logger = logging.getLogger(__name__)
 
+# Process-wide semantic answer cache shared by all agent instances (one per session)
+_SEMANTIC_CACHE: Optional[SemanticCache] = (
+    SemanticCache(
+        dimension=settings.PINECONE_DIMENSION,
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+    )
+    if settings.SEMANTIC_CACHE_ENABLED
+    else None
+)
 
-class AgnoAgentService:
-    """
-    Agno agent service that connects to existing Pinecone index.
-    Uses FastEmbed for local embeddings.
-    """
-    
-    def __init__(
-        self,
-        index_name: Optional[str] = None,
-        agent_name: str = "Knowledge Assistant",
-        model_id: str = "openai/gpt-oss-120b",  # Default Groq model ID
-        temperature: float = 0,
-        top_p: float = 1,
-        search_knowledge: bool = True,
-        enable_chat_history: bool = True,
-        num_history_runs: int = 3,  # Reduced from 5 to 3 - prevents context overflow while maintaining conversation continuity
-        conversation_id: Optional[str] = None  # For saving messages to Supabase
-    ):
-        """
-        Initialize Agno agent with Pinecone knowledge base.
-        
-        Args:
-            index_name: Name of existing Pinecone index (uses config default if not provided)
-            agent_name: Name of the agent
-            model_id: Groq model ID (e.g., "openai/gpt-oss-120b", "llama-3.1-70b-versatile")
-            temperature: Model temperature (default: 0 for deterministic)
-            top_p: Model top_p parameter (default: 1)
-            search_knowledge: Enable automatic knowledge base search
-            enable_chat_history: Enable session-level chat history (requires database)
-            num_history_runs: Number of previous messages to include in context (default: 2, reduced to prevent context overflow)
-        """
-        if not settings.PINECONE_API_KEY:
-            raise ValueError("PINECONE_API_KEY must be set in environment variables")
-        
-        if not settings.GROQ_API_KEY:
-            raise ValueError("GROQ_API_KEY must be set in environment variables")
-        
-        name = index_name or settings.PINECONE_INDEX_NAME
-        if not name:
-            raise ValueError("Index name must be provided or set in PINECONE_INDEX_NAME")
-        
-        self.index_name = name
-        self.agent_name = agent_name
-        self.conversation_id = conversation_id
-
-        # Initialize Supabase client for manual message saving
-        self.supabase_client = SupabaseClient()
-
-        # Initialize FastEmbed embedder
-        self.embedder = FastEmbedEmbedder()
-        
-        # Create Pinecone vector DB with FastEmbed embedder
-        self.vector_db = PineconeDb(
-            name=self.index_name,
-            dimension=settings.PINECONE_DIMENSION,
-            metric=settings.PINECONE_METRIC,
-            spec={"serverless": {"cloud": settings.PINECONE_CLOUD, "region": settings.PINECONE_REGION}},
-            api_key=settings.PINECONE_API_KEY,
-            embedder=self.embedder,  # Use FastEmbed for local embeddings
-            use_hybrid_search=False,  # Can enable if needed, but requires sparse vectors
-        )
-        
-        # Create knowledge base with optimized max_results to prevent context overflow
-        self.knowledge = Knowledge(
-            name="Knowledge Base",
-            vector_db=self.vector_db,
-            max_results=25  # Reduced from 50 to 25 - still handles multi-meeting queries while preventing context overflow
-        )
-        
-        # Metadata registration flag - will be registered lazily on first async query
-        self._metadata_registered = False
-        self._metadata_registration_task = None
-        
-        # Initialize database for chat history (session-level persistence)
-        # Note: Using Supabase REST API for chat history instead of direct database connection
-        # This is more reliable and follows Supabase best practices
-        db = None
-        if enable_chat_history:
-            logger.info("Chat history enabled via Supabase REST API (recommended approach)")
-            # Chat history will be saved manually via Supabase API calls
-        
-        # Initialize Groq model (same pattern as llm_client_identifier.py)
-        groq_model = Groq(
-            id=model_id,
-            api_key=settings.GROQ_API_KEY,
-            temperature=temperature,
-            top_p=top_p
-        )
-        
-        # Create agent with knowledge base and Groq model
-        # Note: No database for chat history - using Supabase REST API instead
-        self.agent = Agent(
-            name=self.agent_name,
-            model=groq_model,
-            knowledge=self.knowledge,
-            search_knowledge=search_knowledge,
-            enable_agentic_knowledge_filters=True,  # Agent automatically extracts metadata filters from queries
-            db=None,  # No database - chat history handled via Supabase REST API
-            add_history_to_context=False,  # Manual history management
-            num_history_runs=0,  # No automatic history
-            store_tool_messages=False,  # Don't store tool messages (knowledge search tools) to prevent context bloat
-            markdown=True,
-            debug_mode=settings.DEBUG,
-            instructions="""You are an expert meeting transcript analyst for a digital agency.
+# System prompt for the meeting assistant (built once at import, shared by all agents)
+_SYSTEM_INSTRUCTIONS = """You are an expert meeting transcript analyst for a digital agency.
 
 GOAL: Answer questions about meeting transcripts by searching the knowledge base and providing comprehensive, accurate responses in natural, conversational language.
 
@@ -276,18 +194,269 @@ IMPORTANT:
 - If you don't have enough context, say so clearly
 - Be thorough - the knowledge base contains detailed meeting transcripts
 - Remember: Users don't see technical details - they see natural, conversational responses"""
-        )
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for prompt budgeting (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+# Prompt prefix for each conversation-history role (other roles are skipped)
+_ROLE_PREFIX = {"user": "User: ", "assistant": "Assistant: "}
+
+# Bounded pool for blocking SDK calls (Supabase) made from async paths
+_IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="agno-io")
+
+
+async def _run_io(fn, *args):
+    """Run a blocking call on the shared I/O pool without stalling the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_IO_POOL, fn, *args)
+
+
+# Recent messages loaded into the prompt (the cache itself lives in supabase_client)
+_HISTORY_FETCH_LIMIT = 10
+
+
+# Stream coalescing: flush buffered tokens once this many characters or seconds accumulate
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_SECONDS = 0.025
+
+# Shared agent components keyed by (index_name, agent_name, model_id, temperature, top_p, search_knowledge)
+_AGENT_POOL: Dict[Tuple, Tuple[FastEmbedEmbedder, PineconeDb, Knowledge, Agent, EmbeddingBatcher]] = {}
+_AGENT_POOL_LOCK = threading.Lock()
+
+# History-only Supabase client shared by every agent service in this process, so sessions
+# reuse one set of HTTP connections. Kept separate from the API's auth client in main.py,
+# whose auth session (set_session) would otherwise leak into history requests.
+_SUPABASE_CLIENT: Optional[SupabaseClient] = None
+_SUPABASE_CLIENT_LOCK = threading.Lock()
+
+
+def _shared_supabase_client() -> SupabaseClient:
+    """Return the process-wide chat-history Supabase client, creating it on first use."""
+    global _SUPABASE_CLIENT
+    with _SUPABASE_CLIENT_LOCK:
+        if _SUPABASE_CLIENT is None:
+            _SUPABASE_CLIENT = SupabaseClient()
+        return _SUPABASE_CLIENT
+
+
+# Set once metadata filter registration has been attempted in this process (success or not)
+_METADATA_DONE = threading.Event()
+
+# Dummy record used to register metadata filter keys with Agno.
+# Uses an old date (2000) and dummy values that won't match real queries.
+_DUMMY_TEXT = "__METADATA_REGISTRATION_ONLY_DO_NOT_USE_IN_SEARCHES__"
+_DUMMY_META = MappingProxyType({
+    "client": ["__dummy__"],  # Client is a list (can contain multiple clients)
+    "date": "2000-01-01",  # Old date that won't match real queries
+    "date_timestamp": 946684800,  # Jan 1, 2000 timestamp
+    "title": "__dummy__",
+    "meeting_id": "__dummy__",
+    "participants": ["__dummy__"],
+})
+_REQUIRED_METADATA_FIELDS = frozenset(_DUMMY_META)
+
+
+class PromptCachingGroq(Groq):
+    """
+    Groq model that also reports prompt-cache hits.
+    Groq caches prompt prefixes automatically (no cache_control / prompt_cache_key parameter), so
+    the static system instructions must stay first and unchanged; per-request history goes in the
+    user message. The stock Groq model drops prompt_tokens_details.cached_tokens from usage.
+    """
+
+    def _get_metrics(self, response_usage) -> MessageMetrics:
+        metrics = super()._get_metrics(response_usage)
+        details = getattr(response_usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) if details is not None else None
+        if cached_tokens:
+            metrics.cache_read_tokens = cached_tokens
+        return metrics
+
+
+def _build_agent_components(
+    index_name: str,
+    agent_name: str,
+    model_id: str,
+    temperature: float,
+    top_p: float,
+    search_knowledge: bool,
+) -> Tuple[FastEmbedEmbedder, PineconeDb, Knowledge, Agent, EmbeddingBatcher]:
+    """
+    Build the embedder, Pinecone vector DB, knowledge base and agent for one configuration.
+    
+    Returns:
+        Tuple of (embedder, vector_db, knowledge, agent, embedding_batcher)
+    """
+    # Initialize FastEmbed embedder (INT8 quantized when FASTEMBED_QUANTIZED is set)
+    embedder = create_embedder()
+    
+    # Batch concurrent query embeddings; one throwaway embedding loads the model before the first
+    # query (the vector DB's search embeddings use the same model)
+    embedding_batcher = EmbeddingBatcher(embedder)
+    try:
+        embedding_batcher.warm_up()
+    except Exception as e:
+        logger.warning(f"Failed to warm up the embedding model: {e}")
+    
+    # Create Pinecone vector DB with FastEmbed embedder
+    vector_db = PineconeDb(
+        name=index_name,
+        dimension=settings.PINECONE_DIMENSION,
+        metric=settings.PINECONE_METRIC,
+        spec={"serverless": {"cloud": settings.PINECONE_CLOUD, "region": settings.PINECONE_REGION}},
+        api_key=settings.PINECONE_API_KEY,
+        embedder=embedder,  # Use FastEmbed for local embeddings
+        use_hybrid_search=False,  # Can enable if needed, but requires sparse vectors
+    )
+    
+    # Create knowledge base with optimized max_results to prevent context overflow
+    knowledge = Knowledge(
+        name="Knowledge Base",
+        vector_db=vector_db,
+        max_results=25  # Reduced from 50 to 25 - still handles multi-meeting queries while preventing context overflow
+    )
+    
+    # Initialize Groq model (same pattern as llm_client_identifier.py)
+    groq_model = PromptCachingGroq(
+        id=model_id,
+        api_key=settings.GROQ_API_KEY,
+        temperature=temperature,
+        top_p=top_p
+    )
+    
+    # Create agent with knowledge base and Groq model
+    # Note: No database for chat history - using Supabase REST API instead
+    agent = Agent(
+        name=agent_name,
+        model=groq_model,
+        knowledge=knowledge,
+        search_knowledge=search_knowledge,
+        enable_agentic_knowledge_filters=True,  # Agent automatically extracts metadata filters from queries
+        db=None,  # No database - chat history handled via Supabase REST API
+        add_history_to_context=False,  # Manual history management
+        num_history_runs=0,  # No automatic history
+        store_tool_messages=False,  # Don't store tool messages (knowledge search tools) to prevent context bloat
+        markdown=True,
+        debug_mode=settings.DEBUG,
+        instructions=_SYSTEM_INSTRUCTIONS
+    )
+    
+    logger.info(f"Built Agno agent components for '{agent_name}' (model={model_id}, index={index_name})")
+    return embedder, vector_db, knowledge, agent, embedding_batcher
+
+
+class AgnoAgentService:
+    """
+    Agno agent service that connects to existing Pinecone index.
+    Uses FastEmbed for local embeddings.
+    """
+
+    # Metadata registration state is shared by all instances in the process
+    _metadata_registered: bool = False
+    _metadata_registration_task: Optional[asyncio.Task] = None
+    
+    def __init__(
+        self,
+        index_name: Optional[str] = None,
+        agent_name: str = "Knowledge Assistant",
+        model_id: str = "openai/gpt-oss-120b",  # Default Groq model ID
+        temperature: float = 0,
+        top_p: float = 1,
+        search_knowledge: bool = True,
+        enable_chat_history: bool = True,
+        num_history_runs: int = 3,  # Reduced from 5 to 3 - prevents context overflow while maintaining conversation continuity
+        conversation_id: Optional[str] = None  # For saving messages to Supabase
+    ):
+        """
+        Initialize Agno agent with Pinecone knowledge base.
+        
+        Args:
+            index_name: Name of existing Pinecone index (uses config default if not provided)
+            agent_name: Name of the agent
+            model_id: Groq model ID (e.g., "openai/gpt-oss-120b", "llama-3.1-70b-versatile")
+            temperature: Model temperature (default: 0 for deterministic)
+            top_p: Model top_p parameter (default: 1)
+            search_knowledge: Enable automatic knowledge base search
+            enable_chat_history: Enable session-level chat history (requires database)
+            num_history_runs: Number of previous messages to include in context (default: 2, reduced to prevent context overflow)
+        """
+        if not settings.PINECONE_API_KEY:
+            raise ValueError("PINECONE_API_KEY must be set in environment variables")
+        
+        if not settings.GROQ_API_KEY:
+            raise ValueError("GROQ_API_KEY must be set in environment variables")
+        
+        name = index_name or settings.PINECONE_INDEX_NAME
+        if not name:
+            raise ValueError("Index name must be provided or set in PINECONE_INDEX_NAME")
+        
+        self.index_name = name
+        self.agent_name = agent_name
+        self.conversation_id = conversation_id
+
+        # Supabase client for manual message saving (shared across sessions)
+        self.supabase_client = _shared_supabase_client()
+
+        # Embedder / vector DB / knowledge / agent are created lazily on the first query
+        # (instances that are never queried don't load FastEmbed or connect to Pinecone)
+        self._pool_key = (self.index_name, agent_name, model_id, temperature, top_p, search_knowledge)
+        self.embedder: Optional[FastEmbedEmbedder] = None
+        self.vector_db: Optional[PineconeDb] = None
+        self.knowledge: Optional[Knowledge] = None
+        self.agent: Optional[Agent] = None
+        self.embedding_batcher: Optional[EmbeddingBatcher] = None
+        self._add_content = None
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._sync_init_lock = threading.Lock()
+        
+        # Note: Using Supabase REST API for chat history instead of direct database connection
+        # This is more reliable and follows Supabase best practices
+        if enable_chat_history:
+            logger.info("Chat history enabled via Supabase REST API (recommended approach)")
+            # Chat history will be saved manually via Supabase API calls
         
         logger.info(f"Initialized Agno agent '{agent_name}' connected to index: {self.index_name}")
     
+    def _lazy_init_sync(self) -> None:
+        """
+        Attach the agent components for this configuration.
+        Reuses embedder / vector DB / knowledge / agent across instances with the same config
+        (avoids reloading the FastEmbed ONNX model for every new session).
+        """
+        with _AGENT_POOL_LOCK:
+            components = _AGENT_POOL.get(self._pool_key)
+            if components is None:
+                components = _build_agent_components(*self._pool_key)
+                _AGENT_POOL[self._pool_key] = components
+        self.embedder, self.vector_db, self.knowledge, self.agent, self.embedding_batcher = components
+
+        # Resolve optional Knowledge method once (not every registration attempt)
+        self._add_content = getattr(self.knowledge, 'add_content', None)
+        self._initialized = True
+
+    def _ensure_initialized(self) -> None:
+        """Initialize agent components on first use (sync callers)."""
+        if not self._initialized:
+            with self._sync_init_lock:
+                if not self._initialized:
+                    self._lazy_init_sync()
+
+    async def _aensure_initialized(self) -> None:
+        """Initialize agent components on first use without blocking the event loop."""
+        if not self._initialized:
+            async with self._init_lock:
+                if not self._initialized:
+                    await _run_io(self._ensure_initialized)
+
     def query(self, question: str, session_id: Optional[str] = "default") -> str:
         """
         Query the agent with a question (synchronous).
         The agent will automatically search the knowledge base if search_knowledge is enabled.
         
-        Note: For metadata registration, use async methods (aquery/astream_query) which properly
-        register metadata filters. This sync method will work but metadata filters may not be
-        registered until the first async call.
+        Note: Metadata filters are registered once per process on the first query (sync or async).
         
         Args:
             question: User question/query
@@ -298,27 +467,14 @@ IMPORTANT:
             Agent response as string
         """
         try:
-            # Try to register metadata if not already registered (sync attempt)
-            if not self._metadata_registered:
+            self._ensure_initialized()
+
+            # Register metadata once per process (a failed attempt is not retried on every query)
+            if not _METADATA_DONE.is_set():
                 try:
-                    if hasattr(self.knowledge, 'add_content'):
-                        self.knowledge.add_content(
-                            text_content="__METADATA_REGISTRATION_ONLY_DO_NOT_USE_IN_SEARCHES__",
-                            metadata={
-                                "client": ["__dummy__"],
-                                "date": "2000-01-01",
-                                "date_timestamp": 946684800,
-                                "title": "__dummy__",
-                                "meeting_id": "__dummy__",
-                                "participants": ["__dummy__"]
-                            }
-                        )
-                        logger.info(f"Registered metadata filter keys via dummy record (sync, date: 2000-01-01)")
-                        self._metadata_registered = True
-                except Exception as e:
-                    # If sync registration fails (e.g., method is async), that's okay
-                    # It will be registered on first async call
-                    logger.debug(f"Sync metadata registration skipped (will register on async call): {e}")
+                    self._register_metadata_sync()
+                finally:
+                    _METADATA_DONE.set()
             
             response = self.agent.run(question, session_id=session_id)
             return response.content if hasattr(response, 'content') else str(response)
@@ -335,6 +491,7 @@ IMPORTANT:
             session_id: Session ID for maintaining conversation history (default: "default")
         """
         try:
+            self._ensure_initialized()
             self.agent.print_response(question, session_id=session_id)
         except Exception as e:
             logger.error(f"Error printing agent response: {e}")
@@ -351,119 +508,122 @@ IMPORTANT:
         Returns:
             Agent response as string
         """
+        await self._aensure_initialized()
+
+        # Answer near-duplicate questions from the semantic cache. Answers are scoped to this
+        # session and today's date, so they never leak across sessions and relative dates
+        # ("last week") are not served stale; aquery sends no conversation history.
+        question_embedding = None
+        cache_scope = f"{session_id}|{datetime.now(timezone.utc).date().isoformat()}"
+        if _SEMANTIC_CACHE is not None:
+            try:
+                question_embedding = await self.embedding_batcher.embed(question)
+                cached = _SEMANTIC_CACHE.lookup(question_embedding, scope=cache_scope)
+                if cached is not None:
+                    logger.info("Answered query from semantic cache")
+                    return cached
+            except Exception as e:
+                logger.debug(f"Semantic cache lookup skipped: {e}")
+                question_embedding = None
+
         try:
             # Ensure metadata is registered before first query
             await self._ensure_metadata_registered()
             
             response = await self.agent.arun(question, session_id=session_id)
-            return response.content if hasattr(response, 'content') else str(response)
+            answer = response.content if hasattr(response, 'content') else str(response)
+            metrics = getattr(response, 'metrics', None)
+            if metrics is not None:
+                logger.debug(f"Prompt tokens: {metrics.input_tokens} (cached: {metrics.cache_read_tokens})")
         except Exception as e:
             logger.error(f"Error in async query: {e}")
             raise
+
+        if question_embedding is not None and answer:
+            _SEMANTIC_CACHE.add(question_embedding, answer, scope=cache_scope)
+        return answer
     
     async def _ensure_metadata_registered(self):
         """
         Lazy registration of metadata filters.
         Called before first query to register metadata schema with Agno.
         """
-        if self._metadata_registered:
+        if AgnoAgentService._metadata_registered or _METADATA_DONE.is_set():
             return
 
-        # Avoid duplicate registration attempts
-        if self._metadata_registration_task and not self._metadata_registration_task.done():
-            await self._metadata_registration_task
+        # Avoid duplicate registration attempts (across all instances)
+        task = AgnoAgentService._metadata_registration_task
+        if task and not task.done():
+            await task
             return
 
         # Start metadata registration as a background task
-        self._metadata_registration_task = asyncio.create_task(self._register_metadata())
-        await self._metadata_registration_task
+        task = asyncio.create_task(self._register_metadata())
+        AgnoAgentService._metadata_registration_task = task
+        try:
+            await task
+        finally:
+            # Attempt registration once per process, even if it failed
+            _METADATA_DONE.set()
 
     async def _register_metadata(self):
         """
-        Register metadata filters with Pinecone (async background task).
+        Register metadata filters (async background task; the Pinecone calls run on the I/O pool).
         """
-        # Our required metadata fields
-        required_fields = {"client", "date", "date_timestamp", "title", "meeting_id", "participants"}
+        await _run_io(self._register_metadata_sync)
 
+    def _seed_filters_from_existing(self) -> bool:
+        """
+        Seed Agno's metadata filter keys from an existing Pinecone record (read-only).
+        
+        Returns:
+            True if a record with all required metadata fields was found
+        """
+        # Any non-zero vector works - we only need one record's metadata
+        probe = [0.0] * settings.PINECONE_DIMENSION
+        probe[0] = 1.0
+        result = self.vector_db.index.query(vector=probe, top_k=1, include_metadata=True)
+        matches = getattr(result, 'matches', None) or []
+        if not matches:
+            logger.info("No existing records to seed metadata filters from")
+            return False
+
+        keys = set(matches[0].metadata or {})
+        missing_fields = _REQUIRED_METADATA_FIELDS - keys
+        if missing_fields:
+            logger.info(f"Existing record is missing metadata fields: {sorted(missing_fields)}")
+            return False
+
+        # Older Agno versions keep discovered keys on the Knowledge instance; newer ones
+        # validate against a contents DB and pass filters through when there is none
+        if hasattr(self.knowledge, 'valid_metadata_filters'):
+            self.knowledge.valid_metadata_filters = set(self.knowledge.valid_metadata_filters or ()) | keys
+        logger.info(f"Seeded metadata filters from existing record: {sorted(keys)}")
+        return True
+
+    def _register_metadata_sync(self) -> None:
+        """
+        Register metadata filter keys with Agno.
+        Prefers reading an existing record; writes the dummy record only if the index has none yet
+        (Agno otherwise only discovers metadata fields through add_content()).
+        """
         try:
-            # Check if OUR specific metadata fields are already registered
-            valid_keys = self.knowledge.get_filters() if hasattr(self.knowledge, 'get_filters') else None
-            if valid_keys:
-                # Check if all our required fields are present
-                valid_keys_set = set(valid_keys) if isinstance(valid_keys, (list, set)) else set()
-                missing_fields = required_fields - valid_keys_set
-
-                if not missing_fields:
-                    logger.info(f"All required metadata filters already registered: {sorted(required_fields)}")
-                    self._metadata_registered = True
-                    return
-                else:
-                    logger.info(f"Some metadata filters missing. Registered: {valid_keys_set}, Missing: {missing_fields}")
-            else:
-                logger.info("No metadata filters registered yet")
+            if self._seed_filters_from_existing():
+                AgnoAgentService._metadata_registered = True
+                return
         except Exception as e:
-            logger.debug(f"Could not check existing filters: {e}")
+            logger.warning(f"Could not seed metadata filters from existing records: {e}")
 
+        if self._add_content is None:
+            return
         try:
-            # Register metadata filter keys by adding a dummy record
-            # This is required because Agno only discovers metadata fields through add_content()
             # The dummy record uses old date (2000) and dummy values that won't match real queries
-            if hasattr(self.knowledge, 'add_content_async'):
-                await self.knowledge.add_content_async(
-                    text_content="__METADATA_REGISTRATION_ONLY_DO_NOT_USE_IN_SEARCHES__",
-                    metadata={
-                        "client": ["__dummy__"],  # Client is a list (can contain multiple clients)
-                        "date": "2000-01-01",  # Old date that won't match real queries
-                        "date_timestamp": 946684800,  # Jan 1, 2000 timestamp
-                        "title": "__dummy__",
-                        "meeting_id": "__dummy__",
-                        "participants": ["__dummy__"]
-                    }
-                )
-                logger.info(f"Registered metadata filter keys via dummy record: {sorted(required_fields)} (date: 2000-01-01, won't interfere)")
-                self._metadata_registered = True
-            elif hasattr(self.knowledge, 'add_content'):
-                # Try sync version
-                self.knowledge.add_content(
-                    text_content="__METADATA_REGISTRATION_ONLY_DO_NOT_USE_IN_SEARCHES__",
-                    metadata={
-                        "client": ["__dummy__"],
-                        "date": "2000-01-01",
-                        "date_timestamp": 946684800,
-                        "title": "__dummy__",
-                        "meeting_id": "__dummy__",
-                        "participants": ["__dummy__"]
-                    }
-                )
-                logger.info(f"Registered metadata filter keys via dummy record: {sorted(required_fields)} (date: 2000-01-01, won't interfere)")
-                self._metadata_registered = True
-
-            # Verify registration
-            try:
-                valid_keys = self.knowledge.get_filters() if hasattr(self.knowledge, 'get_filters') else None
-                if valid_keys:
-                    valid_keys_set = set(valid_keys) if isinstance(valid_keys, (list, set)) else set()
-                    our_fields_registered = required_fields.intersection(valid_keys_set)
-                    if our_fields_registered:
-                        logger.info(f"✓ Verified our metadata filters are registered: {sorted(our_fields_registered)}")
-                    else:
-                        logger.warning(f"⚠ Registration may have failed - our fields not found in: {valid_keys}")
-            except:
-                pass
-
+            self._add_content(text_content=_DUMMY_TEXT, metadata=dict(_DUMMY_META))
+            logger.info(f"Registered metadata filter keys via dummy record: {sorted(_REQUIRED_METADATA_FIELDS)} (date: 2000-01-01, won't interfere)")
+            AgnoAgentService._metadata_registered = True
         except Exception as e:
             logger.warning(f"Failed to register metadata via dummy record: {e}")
-            # Check if filters were registered anyway
-            try:
-                valid_keys = self.knowledge.get_filters() if hasattr(self.knowledge, 'get_filters') else None
-                if valid_keys:
-                    valid_keys_set = set(valid_keys) if isinstance(valid_keys, (list, set)) else set()
-                    our_fields_registered = required_fields.intersection(valid_keys_set)
-                    if our_fields_registered:
-                        logger.info(f"Metadata filters registered (found our fields): {sorted(our_fields_registered)}")
-                        self._metadata_registered = True
-            except:
-                pass
+    
     
     async def astream_query(self, question: str, session_id: Optional[str] = "default", conversation_id: Optional[str] = None):
         """
@@ -481,30 +641,44 @@ IMPORTANT:
         # Store conversation_id for message saving
         self.conversation_id = conversation_id
 
+        await self._aensure_initialized()
+
         # Start metadata registration in background (non-blocking)
         metadata_task = asyncio.create_task(self._ensure_metadata_registered())
 
         # Load conversation history from Supabase and add to context
-        conversation_history = ""
+        history_lines: List[str] = []  # Newest first, bounded by HISTORY_TOKEN_BUDGET
         logger.info(f"Loading conversation history - conversation_id: {conversation_id}, client configured: {self.supabase_client.is_configured() if self.supabase_client else False}")
 
         if conversation_id and self.supabase_client.is_configured():
             try:
-                # Get only the last 10 messages to prevent context overflow (optimized)
-                messages = self.supabase_client.get_messages(conversation_id, limit=10)
-                logger.info(f"Loaded {len(messages)} messages for conversation {conversation_id}")
-
-                # Format as conversation history
-                history_parts = []
-                for msg in messages:
-                    if msg['role'] == 'user':
-                        history_parts.append(f"User: {msg['content']}")
-                    elif msg['role'] == 'assistant':
-                        history_parts.append(f"Assistant: {msg['content']}")
-
-                if history_parts:
-                    conversation_history = "\n\nPrevious conversation:\n" + "\n".join(history_parts) + "\n\n"
-                    logger.info(f"Added conversation history with {len(history_parts)} messages")
+                messages = get_cached_history(conversation_id, _HISTORY_FETCH_LIMIT)
+                if messages is None:
+                    # Fetch history off the event loop so it overlaps with metadata registration
+                    # Get only the last 10 messages to prevent context overflow (optimized)
+                    messages = await _run_io(
+                        self.supabase_client.get_recent_messages, conversation_id, _HISTORY_FETCH_LIMIT
+                    )
+                    store_history(conversation_id, messages)
+                    logger.info(f"Loaded {len(messages)} messages for conversation {conversation_id}")
+                else:
+                    logger.info(f"Using {len(messages)} cached messages for conversation {conversation_id}")
+
+                if messages:
+                    # Keep the most recent messages that fit in the token budget
+                    used_tokens = 0
+                    for msg in reversed(messages):
+                        prefix = _ROLE_PREFIX.get(msg['role'])
+                        if prefix is None:
+                            continue
+                        line = prefix + msg['content']
+                        line_tokens = _estimate_tokens(line)
+                        if used_tokens + line_tokens > settings.HISTORY_TOKEN_BUDGET:
+                            break
+                        history_lines.append(line)
+                        used_tokens += line_tokens
+
+                    logger.info(f"Added conversation history with {len(history_lines)} messages (~{used_tokens} tokens)")
                 else:
                     logger.info("No conversation history to add")
             except Exception as e:
@@ -512,21 +686,42 @@ IMPORTANT:
         else:
             logger.info("Skipping conversation history load - missing conversation_id or Supabase client not configured")
 
-        # Combine history with current question
-        full_question = conversation_history + "Current question: " + question
+        # Combine history (oldest first) with current question
+        buf = io.StringIO()
+        if history_lines:
+            buf.write("\n\nPrevious conversation:\n")
+            for line in reversed(history_lines):
+                buf.write(line)
+                buf.write("\n")
+            buf.write("\n")
+        buf.write("Current question: ")
+        buf.write(question)
+        full_question = buf.getvalue()
         try:
-            # Ensure metadata is registered before first query
-            await self._ensure_metadata_registered()
+            # Wait for the metadata registration started above
+            await metadata_task
             
-            full_response = ""
+            # Coalesce token-sized chunks so each yield carries ~64 chars (fewer SSE sends)
+            pending: List[str] = []
+            pending_len = 0
+            last_flush = time.monotonic()
             async for chunk in self.agent.arun(full_question, session_id=session_id, stream=True):
-                if hasattr(chunk, 'content'):
-                    full_response += chunk.content
-                    yield chunk.content
-                else:
-                    chunk_str = str(chunk)
-                    full_response += chunk_str
-                    yield chunk_str
+                text = getattr(chunk, 'content', None)
+                if not text:
+                    # Skip non-content events (tool calls, debug) instead of sending their str() to the client
+                    continue
+                pending.append(text)
+                pending_len += len(text)
+
+                now = time.monotonic()
+                if pending_len >= _STREAM_FLUSH_CHARS or now - last_flush > _STREAM_FLUSH_SECONDS:
+                    yield "".join(pending)
+                    pending.clear()
+                    pending_len = 0
+                    last_flush = now
+
+            if pending:
+                yield "".join(pending)
 
             # Assistant response is saved in main.py after streaming completes
             # No need to save here to avoid duplicates
@@ -27,11 +27,14 @@ class ClientExtractor:
         self.data_processor = data_processor
         
         # Generic email providers to exclude (not considered client domains)
-        self.generic_providers = {
+        self.generic_providers = frozenset({
             "gmail.com", "outlook.com", "yahoo.com", "hotmail.com", 
             "icloud.com", "aol.com", "protonmail.com", "mail.com",
             "live.com", "msn.com", "ymail.com"
-        }
+        })
+        
+        # Internal + generic domains, checked with a single membership test per email
+        self._excluded_domains = frozenset(self.generic_providers | data_processor.internal_domains)
     
     def extract_clients(self, transcript: Dict[str, Any]) -> List[str]:
         """
@@ -67,32 +70,31 @@ class ClientExtractor:
         
         # Get all unique emails
         all_emails = set()
-        if isinstance(participants, list):
-            for participant in participants:
-                if isinstance(participant, str):
-                    all_emails.add(participant.lower())
-                elif isinstance(participant, dict):
-                    email = participant.get("email", "")
-                    if email:
-                        all_emails.add(email.lower())
+        if isinstance(participants, list) and participants:
+            # Participants are uniformly strings (or dicts) - detect the element type once
+            sample = next((p for p in participants if p is not None), None)
+            if isinstance(sample, str):
+                all_emails.update(p.strip().lower() for p in participants if isinstance(p, str))
+            elif isinstance(sample, dict):
+                all_emails.update(
+                    p["email"].strip().lower() for p in participants
+                    if isinstance(p, dict) and p.get("email")
+                )
         
         if meeting_attendees:
-            for attendee in meeting_attendees:
-                if isinstance(attendee, dict):
-                    email = attendee.get("email", "")
-                    if email:
-                        all_emails.add(email.lower())
+            all_emails.update(
+                a["email"].strip().lower() for a in meeting_attendees
+                if isinstance(a, dict) and a.get("email")
+            )
         
         # Extract external domains (exclude internal team and generic providers)
+        internal_emails = self.data_processor.internal_emails
         external_domains = set()
         for email in all_emails:
             if "@" in email:
-                domain = email.split("@")[1].lower()
-                # Skip internal domains
-                if self.data_processor._is_internal_team(email):
-                    continue
-                # Skip generic email providers
-                if domain in self.generic_providers:
+                domain = email.partition("@")[2]  # Emails are already lowercased above
+                # Skip internal team (domain or individual email) and generic email providers
+                if domain in self._excluded_domains or email in internal_emails:
                     continue
                 # Add external domain
                 external_domains.add(domain)
@@ -100,14 +102,12 @@ class ClientExtractor:
         # Convert domains to client identifiers (domain without TLD, capitalized)
         for domain in external_domains:
             # Extract domain name (part before first dot, or full domain if no dot)
-            domain_parts = domain.split(".")
-            if domain_parts:
-                # Use first part (e.g., "everme" from "everme.ai")
-                domain_name = domain_parts[0]
-                # Capitalize appropriately (e.g., "everme" -> "EverMe", "kingstreetmedia" -> "KingStreetMedia")
-                client_name = domain_name.title()
-                if client_name not in clients:
-                    clients.append(client_name)
+            # Use first part (e.g., "everme" from "everme.ai")
+            domain_name = domain.partition(".")[0]
+            # Capitalize appropriately (e.g., "everme" -> "EverMe", "kingstreetmedia" -> "KingStreetMedia")
+            client_name = domain_name.title()
+            if client_name not in clients:
+                clients.append(client_name)
         
         # If no clients found, return empty list (will be stored as empty list in metadata)
         # This allows the agent to still find these meetings via semantic search
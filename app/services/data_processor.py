@@ -3,56 +3,154 @@ Data processing module for filtering and formatting transcripts.
 """
 import logging
 import asyncio
-from typing import List, Dict, Any, Set
-from collections import defaultdict
+from typing import List, Dict, Any, Set, Tuple, Union
 from app.config import settings
-from app.services.llm_client_identifier import LLMClientIdentifier
+from app.services.llm_client_identifier import LLMClientIdentifier, brand_from_title
 import re
+from functools import lru_cache
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, single-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _format_time(total_seconds: int) -> str:
+    """
+    Format time in whole seconds to readable format (MM:SS or HH:MM:SS).
+    Cached - many sentences share the same second-granularity timestamps.
+    
+    Args:
+        total_seconds: Time in seconds
+        
+    Returns:
+        Formatted time string
+    """
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    secs = total_seconds % 60
+    
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes:02d}:{secs:02d}"
+
+
+def _time_range_suffix(start_time: Any, end_time: Any) -> str:
+    """
+    Build the " [start - end]" suffix, skipping timestamps that are not numeric.
+    
+    Args:
+        start_time: Sentence start time in seconds (may be None or malformed)
+        end_time: Sentence end time in seconds (may be None or malformed)
+        
+    Returns:
+        Suffix string, or "" if neither timestamp is usable
+    """
+    time_parts = []
+    for value in (start_time, end_time):
+        if value is None:
+            continue
+        try:
+            time_parts.append(_format_time(int(value)))
+        except (ValueError, TypeError):
+            pass
+    if not time_parts:
+        return ""
+    return f" [{' - '.join(time_parts)}]"
+
+
+def _contained_in(text: str, candidates: Set[str]) -> Set[str]:
+    """
+    Find which candidate strings occur as substrings of text.
+    Uses one Aho-Corasick pass over text when pyahocorasick is installed and there are
+    enough candidates to pay for building the automaton; otherwise plain `in` checks.
+    
+    Args:
+        text: Text to search
+        candidates: Strings to look for (empty strings are ignored)
+        
+    Returns:
+        Subset of candidates found in text
+    """
+    candidates = {c for c in candidates if c}
+    if ahocorasick is None or len(candidates) < 8:
+        return {c for c in candidates if c in text}
+    automaton = ahocorasick.Automaton()
+    for c in candidates:
+        automaton.add_word(c, c)
+    automaton.make_automaton()
+    return {c for _, c in automaton.iter(text)}
+
+
+# (normalized first label -> domain, [(first label, domain)]) built by DataProcessor._build_domain_index
+DomainIndex = Tuple[Dict[str, str], List[Tuple[str, str]]]
+
+_NORMALIZE_RE = re.compile(r"[\W_]+")
+
+
 class DataProcessor:
     """Processes and formats transcript data."""
     
     def __init__(self):
         # Parse internal domains and emails from config
-        self.internal_domains = set(
+        # (frozensets: read-only after init and safe to share across threads)
+        self.internal_domains = frozenset(
             domain.strip().lower() 
             for domain in settings.INTERNAL_DOMAINS.split(",") 
             if domain.strip()
         )
-        self.internal_emails = set(
+        self.internal_emails = frozenset(
             email.strip().lower() 
             for email in settings.INTERNAL_EMAILS.split(",") 
             if email.strip()
         )
+        # Memoized internal/external classification per normalized email
+        # (internal_domains/internal_emails don't change after __init__)
+        self._internal_cache: Dict[str, bool] = {}
         
         # Initialize LLM client identifier
         self.llm_identifier = LLMClientIdentifier()
         logger.info("LLM client identification initialized")
         
     def _brand_from_title(self, title: str) -> str | None:
-        if not title:
-            return None
-        t = title.strip()
-        for sep in [" x ", " X ", " <> ", " | ", " – ", " - "]:
-            if sep in t:
-                left, right = t.split(sep, 1)
-                if "fruitbowl" in left.lower():
-                    return right.strip().split(":")[0]
-                return left.strip().split(":")[0]
-        return t.split(":")[0].strip()
+        return brand_from_title(title)
 
-    def _map_brand_to_domain(self, brand: str, week_domains: set[str]) -> str | None:
+    def _build_domain_index(self, week_domains: set[str]) -> DomainIndex:
+        """
+        Index domains by their first label for brand lookups.
+        Build once per batch and pass to _map_brand_to_domain instead of the raw domain set.
+        
+        Args:
+            week_domains: Domains seen this week
+            
+        Returns:
+            Tuple of (normalized first label -> domain, [(lowercase first label, domain)])
+        """
+        exact_index: Dict[str, str] = {}
+        substring_list: List[Tuple[str, str]] = []
+        for d in week_domains:
+            label = d.partition(".")[0].lower()
+            exact_index.setdefault(label.replace("-", ""), d)  # First domain wins, as in a linear scan
+            substring_list.append((label, d))
+        return exact_index, substring_list
+
+    def _map_brand_to_domain(self, brand: str, week_domains: Union[set[str], DomainIndex]) -> str | None:
         if not brand:
             return None
+        exact_index, substring_list = (
+            week_domains if isinstance(week_domains, tuple) else self._build_domain_index(week_domains)
+        )
         b = brand.lower().replace(" ", "").replace("-", "")
-        for d in week_domains:
-            if b == d.split(".")[0].lower().replace("-", ""):
-                return d
-        for d in week_domains:
-            if d.split(".")[0].lower() in brand.lower():
+        d = exact_index.get(b)
+        if d is not None:
+            return d
+        brand_lower = brand.lower()
+        for label, d in substring_list:
+            if label in brand_lower:
                 return d
         return None
 
@@ -70,19 +168,29 @@ class DataProcessor:
         if not email:
             return False
         
-        email_lower = email.lower().strip()
-        
-        # Check if email is in internal emails list
-        if email_lower in self.internal_emails:
-            return True
+        return self._is_internal_team_norm(email.lower().strip())
+    
+    def _is_internal_team_norm(self, email_lower: str) -> bool:
+        """
+        Same as _is_internal_team for an email that is already lowercased and stripped.
         
-        # Check if email domain is in internal domains
-        if "@" in email_lower:
-            domain = email_lower.split("@")[1]
-            if domain in self.internal_domains:
-                return True
+        Args:
+            email_lower: Normalized email address
+            
+        Returns:
+            True if internal team member, False otherwise
+        """
+        cached = self._internal_cache.get(email_lower)
+        if cached is not None:
+            return cached
         
-        return False
+        # Check if email is in internal emails list, then if its domain is in internal domains
+        is_internal = (
+            email_lower in self.internal_emails
+            or ("@" in email_lower and email_lower.partition("@")[2] in self.internal_domains)
+        )
+        self._internal_cache[email_lower] = is_internal
+        return is_internal
     
     def _extract_client_emails(self, transcript: Dict[str, Any]) -> List[str]:
         """
@@ -94,21 +202,26 @@ class DataProcessor:
         Returns:
             List of client email addresses
         """
-        client_emails = []
+        seen: Set[str] = set()
+        client_emails: List[str] = []  # Insertion order preserved, set used for O(1) dedup
         
         # Check participants (array of email strings)
         participants = transcript.get("participants", [])
-        if isinstance(participants, list):
-            for participant in participants:
-                if isinstance(participant, str):
-                    email = participant
-                elif isinstance(participant, dict):
-                    email = participant.get("email", "")
-                else:
-                    continue
-                
-                if email and not self._is_internal_team(email):
-                    client_emails.append(email.lower())
+        if isinstance(participants, list) and participants:
+            # Participants are uniformly strings (or dicts) - detect the element type once
+            sample = next((p for p in participants if p is not None), None)
+            if isinstance(sample, str):
+                emails = [p for p in participants if isinstance(p, str)]
+            elif isinstance(sample, dict):
+                emails = [p.get("email", "") for p in participants if isinstance(p, dict)]
+            else:
+                emails = []
+            for email in emails:
+                if email:
+                    email_lower = email.lower().strip()
+                    if email_lower not in seen and not self._is_internal_team_norm(email_lower):
+                        seen.add(email_lower)
+                        client_emails.append(email_lower)
         
         # Check meeting_attendees (array of objects with email)
         meeting_attendees = transcript.get("meeting_attendees", [])
@@ -116,9 +229,10 @@ class DataProcessor:
             for attendee in meeting_attendees:
                 if isinstance(attendee, dict):
                     email = attendee.get("email", "")
-                    if email and not self._is_internal_team(email):
-                        email_lower = email.lower()
-                        if email_lower not in client_emails:
+                    if email:
+                        email_lower = email.lower().strip()
+                        if email_lower not in seen and not self._is_internal_team_norm(email_lower):
+                            seen.add(email_lower)
                             client_emails.append(email_lower)
         
         return client_emails
@@ -143,37 +257,24 @@ class DataProcessor:
         if not client_emails:
             return "Unknown Client"
         
-        # If single client, use email prefix
-        if len(client_emails) == 1:
-            email = client_emails[0]
-            if "@" in email:
-                # Extract prefix (part before @) and clean it up
-                prefix = email.split("@")[0]
-                # Capitalize first letter for readability
-                return prefix.title() if prefix else "Unknown Client"
-            return email
-        
-        # Multiple clients - use first client's prefix + " and others"
+        # Extract the first client's prefix (part before @) once
+        count = len(client_emails)
         first_email = client_emails[0]
-        if "@" in first_email:
-            prefix = first_email.split("@")[0]
-            base_name = prefix.title() if prefix else "Client"
-            return f"{base_name} and {len(client_emails) - 1} others"
+        prefix, at, _ = first_email.partition("@")
+        if not at:
+            return first_email if count == 1 else f"{count} Clients"
         
-        return f"{len(client_emails)} Clients"
+        # Single client uses the prefix; multiple clients add " and others"
+        if count == 1:
+            return prefix.title() if prefix else "Unknown Client"
+        base_name = prefix.title() if prefix else "Client"
+        return f"{base_name} and {count - 1} others"
     
     def _normalize_label(self, s: str) -> str:
-        return re.sub(r"[\W_]+", "", (s or "").lower()).strip()
+        return _NORMALIZE_RE.sub("", (s or "").lower())
 
     def _title_brand(self, title: str) -> str:
-        t = (title or "").strip()
-        for sep in [" x ", " X ", " <> ", " | ", " – ", " - "]:
-            if sep in t:
-                left, right = t.split(sep, 1)
-                if "fruitbowl" in left.lower():
-                    return right.strip().split(":")[0]
-                return left.strip().split(":")[0]
-        return t.split(":")[0].strip()
+        return self._brand_from_title(title) or ""
 
     async def filter_for_client_async(self, transcripts: List[Dict[str, Any]], client_query: str, use_llm: bool = True) -> List[Dict[str, Any]]:
         """
@@ -188,70 +289,85 @@ class DataProcessor:
         query = (client_query or "").strip()
         query_lower = query.lower()
 
+        # External domains per meeting, parsed once and reused by Step 2
+        externals_cache: Dict[Any, Set[str]] = {}
+
         def externals_of(m: Dict[str, Any]) -> Set[str]:
-            try:
-                return self.llm_identifier._extract_external_domains(m, self.internal_domains)
-            except Exception:
-                return set()
+            key = m.get("id") or id(m)
+            externals = externals_cache.get(key)
+            if externals is None:
+                try:
+                    externals = self.llm_identifier._extract_external_domains(m, self.internal_domains)
+                except Exception:
+                    externals = set()
+                externals_cache[key] = externals
+            return externals
 
         kept: List[Dict[str, Any]] = []
+        kept_ids: Set[Any] = set()  # Ids of Step 1 matches, for the Step 2 skip check
         
         logger.info(f"[FILTER-STEP1] Starting direct search (grep-style) for client '{query}' in {len(transcripts)} transcripts")
 
+        # Per-transcript lines are debug-only; skip building them entirely otherwise
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Step 1: Direct search (grep-style) - simple string matching
         step1_matches = 0
+        searchable = []
         for m in transcripts:
-            transcript_id = m.get("id", "unknown")
             title = (m.get("title", "") or "").lower()
             externals = externals_of(m)
             organizer = (m.get("organizer_email") or "").lower()
             host = (m.get("host_email") or "").lower()
             
             # Extract domains from organizer/host
-            org_dom = organizer.split("@")[1] if "@" in organizer else ""
-            host_dom = host.split("@")[1] if "@" in host else ""
+            org_dom = organizer.partition("@")[2] if "@" in organizer else ""
+            host_dom = host.partition("@")[2] if "@" in host else ""
             
-            match_reason = None
+            externals_lower = [d.lower() for d in externals]
+            searchable.append((m, title, externals, externals_lower, org_dom, host_dom))
+        
+        # Reverse direction (domain inside query): resolve every distinct domain against the query once
+        domains_in_query = _contained_in(
+            query_lower,
+            {d for _, _, _, ext, org, host in searchable for d in (org, host, *ext)},
+        )
+        
+        for m, title, externals, externals_lower, org_dom, host_dom in searchable:
+            transcript_id = m.get("id", "unknown")
             
-            # Direct search: query appears in title OR matches any external domain OR organizer/host domain
-            if query_lower in title:
-                match_reason = f"title contains '{query}'"
+            # Direct search: query appears in title OR matches any external domain OR organizer/host domain.
+            # One substring scan over all searchable fields, plus the reverse check (domain inside query).
+            haystack = "\n".join((title, org_dom, host_dom, *externals_lower))
+            if query_lower in haystack or not domains_in_query.isdisjoint((org_dom, host_dom, *externals_lower)):
                 kept.append(m)
+                kept_ids.add(m.get("id"))
                 step1_matches += 1
-                logger.info(f"[FILTER-STEP1] ✓ {transcript_id}: MATCHED - {match_reason} | Title: '{m.get('title', 'N/A')}'")
-                continue
-            
-            # Check if query matches any external domain (exact or partial)
-            for ext_domain in externals:
-                if query_lower in ext_domain.lower() or ext_domain.lower() in query_lower:
-                    match_reason = f"external domain '{ext_domain}' matches '{query}'"
-                    kept.append(m)
-                    step1_matches += 1
-                    logger.info(f"[FILTER-STEP1] ✓ {transcript_id}: MATCHED - {match_reason} | Title: '{m.get('title', 'N/A')}' | Domains: {list(externals)}")
-                    break
-            
-            if match_reason:
-                continue
-            
-            # Check organizer/host domains
-            if org_dom and (query_lower in org_dom or org_dom in query_lower):
-                match_reason = f"organizer domain '{org_dom}' matches '{query}'"
-                kept.append(m)
-                step1_matches += 1
-                logger.info(f"[FILTER-STEP1] ✓ {transcript_id}: MATCHED - {match_reason} | Title: '{m.get('title', 'N/A')}'")
-                continue
-            if host_dom and (query_lower in host_dom or host_dom in query_lower):
-                match_reason = f"host domain '{host_dom}' matches '{query}'"
-                kept.append(m)
-                step1_matches += 1
-                logger.info(f"[FILTER-STEP1] ✓ {transcript_id}: MATCHED - {match_reason} | Title: '{m.get('title', 'N/A')}'")
+                if debug:
+                    # Disambiguation only feeds the log message (same precedence as before)
+                    if query_lower in title:
+                        match_reason = f"title contains '{query}'"
+                    else:
+                        match_reason = None
+                        for ext_domain, ext_lower in zip(externals, externals_lower):
+                            if query_lower in ext_lower or ext_lower in query_lower:
+                                match_reason = f"external domain '{ext_domain}' matches '{query}' | Domains: {list(externals)}"
+                                break
+                        if match_reason is None:
+                            if org_dom and (query_lower in org_dom or org_dom in query_lower):
+                                match_reason = f"organizer domain '{org_dom}' matches '{query}'"
+                            else:
+                                match_reason = f"host domain '{host_dom}' matches '{query}'"
+                    logger.debug("[FILTER-STEP1] ✓ %s: MATCHED - %s | Title: %r", transcript_id, match_reason, m.get('title', 'N/A'))
                 continue
             
             # No match in Step 1
+            if not debug:
+                continue
             if externals:
-                logger.debug(f"[FILTER-STEP1] ✗ {transcript_id}: No match | Title: '{m.get('title', 'N/A')}' | Has external domains: {list(externals)}")
+                logger.debug("[FILTER-STEP1] ✗ %s: No match | Title: %r | Has external domains: %s", transcript_id, m.get('title', 'N/A'), list(externals))
             else:
-                logger.debug(f"[FILTER-STEP1] ✗ {transcript_id}: No match | Title: '{m.get('title', 'N/A')}' | No external domains (will go to Step 2 if use_llm=True)")
+                logger.debug("[FILTER-STEP1] ✗ %s: No match | Title: %r | No external domains (will go to Step 2 if use_llm=True)", transcript_id, m.get('title', 'N/A'))
         
         logger.info(f"[FILTER-STEP1] Step 1 complete: {step1_matches} matches found out of {len(transcripts)} transcripts")
 
@@ -259,9 +375,8 @@ class DataProcessor:
         step2_matches = 0
         if use_llm:
             remaining: List[Dict[str, Any]] = []
-            already_ids = {m.get("id") for m in kept}
             for m in transcripts:
-                if m.get("id") in already_ids:
+                if m.get("id") in kept_ids:
                     continue
                 if externals_of(m):
                     continue  # Skip meetings with external domains (they should have been caught in Step 1)
@@ -285,11 +400,11 @@ class DataProcessor:
                     if ta.client_name and query_lower in ta.client_name.lower():
                         kept.append(m)
                         step2_matches += 1
-                        logger.info(f"[FILTER-STEP2] ✓ {transcript_id}: MATCHED via LLM - client_name='{ta.client_name}' | Title: '{m.get('title', 'N/A')}'")
+                        logger.debug("[FILTER-STEP2] ✓ %s: MATCHED via LLM - client_name=%r | Title: %r", transcript_id, ta.client_name, m.get('title', 'N/A'))
                     elif ta.client_domain and query_lower in ta.client_domain.lower():
                         kept.append(m)
                         step2_matches += 1
-                        logger.info(f"[FILTER-STEP2] ✓ {transcript_id}: MATCHED via LLM - client_domain='{ta.client_domain}' | Title: '{m.get('title', 'N/A')}'")
+                        logger.debug("[FILTER-STEP2] ✓ %s: MATCHED via LLM - client_domain=%r | Title: %r", transcript_id, ta.client_domain, m.get('title', 'N/A'))
                 logger.info(f"[FILTER-STEP2] Step 2 complete: {step2_matches} additional matches found")
             else:
                 logger.info(f"[FILTER-STEP2] No domainless meetings to analyze (all were matched in Step 1 or have external domains)")
@@ -314,49 +429,37 @@ class DataProcessor:
         
         logger.info(f"Using LLM (domain-batched) to identify clients for {len(transcripts)} meetings...")
         # Run domain-batched identification with parallel LLM calls (concurrency=4)
+        # externals_by_id is filled with each meeting's external domains for the passes below
+        externals_by_id: Dict[Any, Set[str]] = {}
         client_assignments = await self.llm_identifier.identify_clients_batched(
             meetings=transcripts,
             internal_domains=self.internal_domains,
             max_concurrency=4,
+            externals_by_id=externals_by_id,
         )
         
         # Group transcripts by client domain (LLM decisions only for meetings with domains)
-        client_transcripts = defaultdict(list)
+        # Same pass collects unassigned meetings with no external domains for title-based mapping
+        client_transcripts: Dict[str, List[Dict[str, Any]]] = {}
+        assigned_ids: Set[Any] = set()  # Ids placed in client_transcripts so far
+        domainless: List[Dict[str, Any]] = []
         for transcript in transcripts:
             transcript_id = transcript.get("id")
             assignment = client_assignments.get(transcript_id)
             if assignment and assignment.client_domain:
                 client_domain = assignment.client_domain
-                client_name = client_domain.split(".")[0].title()
-                client_transcripts[client_name].append(transcript)
+                client_name = client_domain.partition(".")[0].title()
+                client_transcripts.setdefault(client_name, []).append(transcript)
+                assigned_ids.add(transcript_id)
                 logger.info(f"[ASSIGN] {transcript_id} → {client_name} (conf={assignment.confidence:.2f})")
             else:
                 logger.warning(f"[ASSIGN] No client for {transcript_id} title='{transcript.get('title','N/A')}' (skipped)")
+                if not externals_by_id.get(transcript_id):
+                    domainless.append(transcript)
 
         # Pass 2: Title-based mapping for meetings with no external domains
-        # Build list of domainless transcripts not yet assigned
-        domainless: List[Dict[str, Any]] = []
-        known_domains = set()
-        for t in transcripts:
-            try:
-                for d in self.llm_identifier._extract_external_domains(t, self.internal_domains):
-                    known_domains.add(d)
-            except Exception:
-                pass
-        assigned_ids = set(client_assignments.keys())
-        for t in transcripts:
-            tid = t.get("id")
-            # consider only those with no LLM assignment and no externals
-            if tid in assigned_ids and client_assignments[tid] and client_assignments[tid].client_domain:
-                continue
-            try:
-                externals = self.llm_identifier._extract_external_domains(t, self.internal_domains)
-            except Exception:
-                externals = set()
-            if not externals:
-                domainless.append(t)
-
         if domainless:
+            known_domains = set().union(*externals_by_id.values())
             logger.info(f"[ASSIGN-TITLE] Running title-based mapping for {len(domainless)} domainless meetings")
             title_map = await self.llm_identifier.identify_clients_from_titles(
                 meetings=domainless,
@@ -372,22 +475,23 @@ class DataProcessor:
                 if not ta:
                     continue
                 if ta.client_domain:
-                    cname = ta.client_domain.split(".")[0].title()
-                    client_transcripts[cname].append(t)
+                    cname = ta.client_domain.partition(".")[0].title()
+                    client_transcripts.setdefault(cname, []).append(t)
+                    assigned_ids.add(tid)
                     logger.info(f"[ASSIGN-TITLE] {tid} → {cname} via title-domain (conf={ta.confidence})")
                 elif allow_brand and ta.client_name:
                     # Deterministic acceptance for brand-only when enabled
                     cname = ta.client_name.title()
-                    client_transcripts[cname].append(t)
+                    client_transcripts.setdefault(cname, []).append(t)
+                    assigned_ids.add(tid)
                     logger.info(f"[ASSIGN-TITLE] {tid} → {cname} via title-brand (accepted; confidence ignored)")
                 else:
                     logger.info(f"[ASSIGN-TITLE] {tid} no accepted title-based mapping (allow_brand={allow_brand}, conf={ta.confidence})")
         # Optional ambiguous bucket for remaining unassigned
         if settings.INCLUDE_AMBIGUOUS_BUCKET:
-            assigned_set = {t.get("id") for cl in client_transcripts.values() for t in cl}
             for t in transcripts:
                 tid = t.get("id")
-                if tid in assigned_set:
+                if tid in assigned_ids:
                     continue
                 title = (t.get("title") or "").strip()
                 if not title or title.lower().startswith("untitled"):
@@ -395,17 +499,17 @@ class DataProcessor:
                 # Avoid internal-only obvious patterns
                 if "fruitbowl" in title.lower():
                     continue
-                bucket = title.split(":")[0].strip()
+                bucket = title.partition(":")[0].strip()
                 if not bucket:
                     continue
-                client_transcripts[bucket].append(t)
+                client_transcripts.setdefault(bucket, []).append(t)
                 logger.info(f"[ASSIGN-AMBIGUOUS] {tid} → {bucket} (exact-title bucket)")
         
         logger.info(f"Filtered {len(transcripts)} transcripts into {len(client_transcripts)} unique clients")
         for client_id, client_transcript_list in client_transcripts.items():
             logger.info(f"  - {client_id}: {len(client_transcript_list)} meeting(s)")
         
-        return dict(client_transcripts)
+        return client_transcripts
 
     def format_conversations(self, conversations: List[Dict[str, Any]]) -> str:
         """
@@ -417,47 +521,21 @@ class DataProcessor:
         Returns:
             Formatted text string
         """
-        formatted_text = ""
+        parts: List[str] = []  # Joined once at the end (avoids quadratic string concatenation)
+        separator = "=" * 60
         
         for conversation in conversations:
             # Add meeting header
             meeting_title = conversation.get("title", "Untitled Meeting")
             meeting_date = conversation.get("dateString", conversation.get("date", ""))
             
-            formatted_text += f"\n{'='*60}\n"
-            formatted_text += f"Meeting: {meeting_title}\n"
-            formatted_text += f"Date: {meeting_date}\n"
-            formatted_text += f"{'='*60}\n\n"
+            parts.append(f"\n{separator}\nMeeting: {meeting_title}\nDate: {meeting_date}\n{separator}\n\n")
             
             # Format transcript content
-            transcript_content = self._extract_transcript_content(conversation)
-            formatted_text += transcript_content
-            formatted_text += "\n\n"
+            parts.append(self._extract_transcript_content(conversation))
+            parts.append("\n\n")
         
-        return formatted_text.strip()
-    
-    def _format_time(self, seconds: float) -> str:
-        """
-        Format time in seconds to readable format (MM:SS or HH:MM:SS).
-        
-        Args:
-            seconds: Time in seconds
-            
-        Returns:
-            Formatted time string
-        """
-        try:
-            total_seconds = int(seconds)
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            secs = total_seconds % 60
-            
-            if hours > 0:
-                return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-            else:
-                return f"{minutes:02d}:{secs:02d}"
-        except (ValueError, TypeError):
-            return ""
+        return "".join(parts).strip()
     
     def _extract_transcript_content(self, transcript: Dict[str, Any]) -> str:
         """
@@ -471,7 +549,7 @@ class DataProcessor:
         Returns:
             Formatted conversation text in natural readable format
         """
-        formatted_content = ""
+        lines: List[str] = []
         
         # Check for sentences array (from complete transcript query)
         if "sentences" in transcript and transcript["sentences"]:
@@ -485,32 +563,25 @@ class DataProcessor:
                     continue
                 
                 # Format: Speaker Name: text [00:00 - 00:05]
-                line = f"{speaker}: {text}"
-                
-                # Add time range if available
-                if start_time is not None or end_time is not None:
-                    time_parts = []
-                    if start_time is not None:
-                        start_str = self._format_time(start_time)
-                        if start_str:
-                            time_parts.append(start_str)
-                    if end_time is not None:
-                        end_str = self._format_time(end_time)
-                        if end_str:
-                            time_parts.append(end_str)
-                    
-                    if time_parts:
-                        if len(time_parts) == 2:
-                            time_range = f"[{time_parts[0]} - {time_parts[1]}]"
-                        else:
-                            time_range = f"[{time_parts[0]}]"
-                        line += f" {time_range}"
+                try:
+                    if start_time is not None and end_time is not None:
+                        line = f"{speaker}: {text} [{_format_time(int(start_time))} - {_format_time(int(end_time))}]"
+                    elif start_time is not None:
+                        line = f"{speaker}: {text} [{_format_time(int(start_time))}]"
+                    elif end_time is not None:
+                        line = f"{speaker}: {text} [{_format_time(int(end_time))}]"
+                    else:
+                        line = f"{speaker}: {text}"
+                except (ValueError, TypeError):
+                    # Malformed timestamp - keep whichever part is valid
+                    line = f"{speaker}: {text}{_time_range_suffix(start_time, end_time)}"
                 
-                formatted_content += line + "\n"
+                lines.append(line)
+                lines.append("\n")
         
-        if not formatted_content:
+        if not lines:
             logger.warning(f"No transcript content found for transcript {transcript.get('id', 'unknown')}")
-            formatted_content = "[Transcript content not available for this meeting]"
+            return "[Transcript content not available for this meeting]"
         
-        return formatted_content
+        return "".join(lines)
 
@@ -0,0 +1,240 @@
+"""
+Embedder implementations for the Agno agent.
+
+Provides:
+- l2_normalize(): client-side L2 normalization (idempotent for unit vectors)
+- NormalizedFastEmbedEmbedder: FastEmbed with guaranteed unit-length output
+- QuantizedFastEmbedEmbedder: INT8 OpenVINO model via Optimum Intel (optional dependency)
+- create_embedder(): picks the configured embedder, falling back to plain FastEmbed
+- EmbeddingBatcher: coalesces concurrent embedding requests into one batched call
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import numpy as np
+from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def l2_normalize(vectors) -> np.ndarray:
+    """
+    L2-normalize one vector or a 2-D batch of vectors.
+    Unit vectors are returned unchanged, so normalizing twice is harmless.
+
+    Args:
+        vectors: Vector or batch of vectors (rows)
+
+    Returns:
+        FP32 array of unit-length vectors with the same shape
+    """
+    arr = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=-1, keepdims=True)
+    return arr / (norms + 1e-12)
+
+
+@dataclass
+class NormalizedFastEmbedEmbedder(FastEmbedEmbedder):
+    """
+    FastEmbedEmbedder whose outputs are always unit length, so a dotproduct
+    Pinecone index ranks exactly like cosine without server-side normalization.
+    """
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts in one model call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of L2-normalized embedding vectors
+        """
+        return l2_normalize(np.stack(list(self.client.embed(texts)))).tolist()
+
+    def get_embedding(self, text: str) -> List[float]:
+        return l2_normalize(super().get_embedding(text)).tolist()
+
+
+@dataclass
+class QuantizedFastEmbedEmbedder(NormalizedFastEmbedEmbedder):
+    """
+    FastEmbedEmbedder that routes embeddings through an INT8-quantized OpenVINO model.
+    Requires `optimum[openvino]` (uses AVX-512 VNNI / AMX where available).
+    """
+
+    quantized_model: Optional[Any] = None
+    tokenizer: Optional[Any] = None
+
+    def _load_quantized(self):
+        """Export and load the INT8 model on first use."""
+        if self.quantized_model is None:
+            from optimum.intel import OVModelForFeatureExtraction
+            from transformers import AutoTokenizer
+
+            self.tokenizer = AutoTokenizer.from_pretrained(self.id)
+            self.quantized_model = OVModelForFeatureExtraction.from_pretrained(
+                self.id,
+                export=True,
+                load_in_8bit=True,
+            )
+            logger.info(f"Loaded INT8 quantized embedding model: {self.id}")
+        return self.tokenizer, self.quantized_model
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts in one forward pass.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of L2-normalized embedding vectors
+        """
+        tokenizer, model = self._load_quantized()
+        inputs = tokenizer(texts, padding=True, truncation=True, max_length=512, return_tensors="np")
+        outputs = model(**inputs)
+        # BGE models use the [CLS] token as the sentence embedding
+        cls = np.asarray(outputs.last_hidden_state)[:, 0]
+        return l2_normalize(cls).tolist()
+
+    def get_embedding(self, text: str) -> List[float]:
+        try:
+            return self.get_embeddings([text])[0]
+        except Exception as e:
+            logger.error(f"Quantized embedding failed: {e}")
+            raise
+
+
+def create_embedder() -> FastEmbedEmbedder:
+    """
+    Create the embedder configured by FASTEMBED_QUANTIZED.
+    Falls back to NormalizedFastEmbedEmbedder if Optimum Intel is missing, the quantized
+    model fails to load, or its output dimension (probed with one embedding) does not
+    match PINECONE_DIMENSION.
+
+    Returns:
+        Embedder instance
+    """
+    if settings.FASTEMBED_QUANTIZED:
+        embedder = QuantizedFastEmbedEmbedder()
+        try:
+            import optimum.intel  # noqa: F401
+        except ImportError:
+            logger.warning("FASTEMBED_QUANTIZED is set but optimum[openvino] is not installed - using FastEmbed")
+        else:
+            # Probe the loaded model: the dataclass default says nothing about its real output size
+            try:
+                dimension = len(embedder.get_embedding("dim-probe"))
+            except Exception as e:
+                logger.warning(f"Could not load quantized embedding model ({e}) - using FastEmbed")
+            else:
+                if dimension == settings.PINECONE_DIMENSION:
+                    embedder.dimensions = dimension
+                    return embedder
+                logger.warning(
+                    f"Quantized model dimension {dimension} does not match "
+                    f"PINECONE_DIMENSION={settings.PINECONE_DIMENSION} - using FastEmbed"
+                )
+    return NormalizedFastEmbedEmbedder()
+
+
+def embed_texts(embedder: FastEmbedEmbedder, texts: List[str]) -> List[List[float]]:
+    """
+    Embed several texts with one model call.
+
+    Args:
+        embedder: Agno FastEmbed-based embedder
+        texts: Texts to embed
+
+    Returns:
+        List of embedding vectors (same order as texts)
+    """
+    get_embeddings = getattr(embedder, "get_embeddings", None)
+    if get_embeddings is not None:
+        return get_embeddings(texts)
+    # FastEmbedEmbedder only exposes single-text embedding; batch through its TextEmbedding client
+    return [np.asarray(e).tolist() for e in embedder.client.embed(texts)]
+
+
+class EmbeddingBatcher:
+    """
+    Asynchronous micro-batcher for embedding requests.
+    Requests arriving within a short window are embedded together, so the
+    ONNX runtime's fixed per-call overhead is paid once per batch.
+    """
+
+    def __init__(self, embedder: FastEmbedEmbedder, window_seconds: float = 0.02, max_batch_size: int = 32):
+        """
+        Initialize the batcher.
+
+        Args:
+            embedder: Embedder used for the batched calls
+            window_seconds: How long to wait for more requests after the first one
+            max_batch_size: Maximum texts per model call
+        """
+        self.embedder = embedder
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def warm_up(self) -> None:
+        """Embed one throwaway text so the model is loaded before the first real request."""
+        embed_texts(self.embedder, ["warmup"])
+        logger.info("Embedding model warmed up")
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a single text, batched with any concurrent requests.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # (Re)bind queue and worker to the running event loop
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await asyncio.to_thread(embed_texts, self.embedder, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
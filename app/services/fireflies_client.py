@@ -2,14 +2,214 @@
 Fireflies API client for fetching transcripts.
 Fireflies API uses GraphQL, not REST.
 """
+import asyncio
+import hashlib
 import httpx
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from app.config import settings
 
+try:
+    import orjson  # Faster JSON encoding/decoding (falls back to stdlib json)
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses worth retrying (rate limiting and upstream hiccups)
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5  # Seconds; doubled per attempt
+_RETRY_MAX_DELAY = 30.0
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(content: bytes) -> Dict[str, Any]:
+    """Parse a JSON response body (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Compute the backoff before the next attempt, honoring Retry-After when present.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        response: Failed response, if any
+        
+    Returns:
+        Delay in seconds
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(_RETRY_MAX_DELAY, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form - fall back to exponential backoff
+    return min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+# GraphQL documents (based on official Fireflies docs), composed once at import
+_BASIC_SELECTION = """
+        id
+        title
+        date
+        dateString
+        duration
+        participants
+        organizer_email
+        host_email
+        meeting_attendees {
+            email
+            name
+            displayName
+        }"""
+
+# Detail subselections, also requested on the list query so the weekly path needs one round trip.
+# Only sentence fields consumed downstream (speaker_id: TranscriptCleaner merging; times: formatting).
+_DETAIL_SELECTION = """
+        sentences {
+            speaker_name
+            speaker_id
+            text
+            start_time
+            end_time
+        }
+        summary {
+            overview
+            action_items
+            keywords
+        }"""
+
+# Every sentence field, for callers that need index/raw_text (see _get_transcript_details_full)
+_FULL_DETAIL_SELECTION = """
+        sentences {
+            index
+            speaker_name
+            speaker_id
+            text
+            raw_text
+            start_time
+            end_time
+        }
+        summary {
+            overview
+            action_items
+            keywords
+        }"""
+
+_LIST_QUERY_TEMPLATE = """
+query GetTranscriptsList($fromDate: DateTime, $toDate: DateTime, $limit: Int, $skip: Int) {
+    transcripts(fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip) {%s
+        transcript_url%s
+    }
+}
+"""
+_TRANSCRIPTS_LIST_QUERY = _LIST_QUERY_TEMPLATE % (_BASIC_SELECTION, "")
+_TRANSCRIPTS_LIST_DETAILED_QUERY = _LIST_QUERY_TEMPLATE % (_BASIC_SELECTION, _DETAIL_SELECTION)
+
+_TRANSCRIPT_QUERY_TEMPLATE = """
+query GetTranscript($transcriptId: String!) {
+    transcript(id: $transcriptId) {%s%s
+    }
+}
+"""
+_TRANSCRIPT_DETAIL_QUERY = _TRANSCRIPT_QUERY_TEMPLATE % (_BASIC_SELECTION, _DETAIL_SELECTION)
+_TRANSCRIPT_FULL_DETAIL_QUERY = _TRANSCRIPT_QUERY_TEMPLATE % (_BASIC_SELECTION, _FULL_DETAIL_SELECTION)
+
+# Shared fragment for aliased multi-transcript queries (see _get_transcripts_details_batch)
+_TRANSCRIPT_FIELDS_FRAGMENT = """
+fragment TFields on Transcript {%s%s
+}
+""" % (_BASIC_SELECTION, _DETAIL_SELECTION)
+
+
+@lru_cache(maxsize=256)
+def _query_hash(query: str) -> str:
+    """SHA-256 of a query document (Automatic Persisted Query id). Constant queries hash once."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _is_persisted_query_miss(result: Dict[str, Any]) -> bool:
+    """Whether the server asked for the full query text (APQ cache miss or APQ unsupported)."""
+    for err in result.get("errors") or []:
+        code = (err.get("extensions") or {}).get("code")
+        if code in ("PERSISTED_QUERY_NOT_FOUND", "PERSISTED_QUERY_NOT_SUPPORTED"):
+            return True
+        if err.get("message") in ("PersistedQueryNotFound", "PersistedQueryNotSupported"):
+            return True
+    return False
+
+
+def _is_persisted_query_unsupported(result: Dict[str, Any]) -> bool:
+    """Whether the server said it does not support APQ at all (as opposed to a per-query miss)."""
+    for err in result.get("errors") or []:
+        if (err.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_SUPPORTED":
+            return True
+        if err.get("message") == "PersistedQueryNotSupported":
+            return True
+    return False
+
+
+# Set once the server rejects a hash-only request outright (no APQ support, typically HTTP 400
+# "must provide query"); afterwards every query is sent in full for the rest of the process
+_APQ_UNSUPPORTED = threading.Event()
+
+# Pre-hash the constant documents at import
+for _query in (_TRANSCRIPTS_LIST_QUERY, _TRANSCRIPTS_LIST_DETAILED_QUERY, _TRANSCRIPT_DETAIL_QUERY):
+    _query_hash(_query)
+
+_PAGE_SIZE = 50  # Fireflies maximum per transcripts query
+_PAGE_FANOUT = 4  # Further pages requested concurrently once a page comes back full
+_DETAIL_BATCH_SIZE = 10  # Transcripts per aliased query
+_CACHE_MAX_ENTRIES = 1000  # Per cache; least recently used entries are evicted first
+
+
+def _cache_get(cache: "OrderedDict[Any, Tuple[float, Any]]", key: Any, ttl_seconds: float) -> Any:
+    """
+    Return a fresh cached value (refreshing its LRU position), or None.
+    
+    Args:
+        cache: Cache mapping key -> (stored_at, value)
+        key: Cache key
+        ttl_seconds: Maximum age of a usable entry
+        
+    Returns:
+        Cached value, or None on miss/expiry
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= ttl_seconds:
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: "OrderedDict[Any, Tuple[float, Any]]", key: Any, value: Any) -> None:
+    """Store a value, evicting the least recently used entry when full."""
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
 
 class FirefliesClient:
     """Client for interacting with Fireflies API (GraphQL)."""
@@ -24,10 +224,79 @@ class FirefliesClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # Long-lived client so connections (TCP + TLS) are reused across queries.
+        # HTTP/2 multiplexes concurrent requests over one connection (falls back to HTTP/1.1
+        # if the server does not negotiate h2), so a small pool is enough.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+        )
+        # LRU + TTL caches: transcript_id -> details, (from, to, limit) -> list.
+        # Only touched from the event loop without awaits in between, so no lock is needed.
+        self._detail_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._list_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "FirefliesClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def _post_graphql(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a GraphQL payload and parse the JSON response.
+        
+        Args:
+            payload: GraphQL request payload
+            
+        Returns:
+            Parsed response dictionary
+        """
+        body = _dumps(payload)  # Content-Type is already set in self.headers
+        response = await self._client.post("/graphql", content=body)
+        response.raise_for_status()
+        return _loads(response.content)
+    
+    async def _post_with_retries(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a GraphQL payload, retrying transient failures with backoff.
+        
+        Args:
+            payload: GraphQL request payload
+            
+        Returns:
+            Parsed response dictionary
+        """
+        max_retries = max(1, settings.FIREFLIES_MAX_RETRIES)
+        for attempt in range(max_retries):
+            try:
+                return await self._post_graphql(payload)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _RETRYABLE_STATUS or attempt == max_retries - 1:
+                    raise
+                delay = _retry_delay(attempt, e.response)
+                logger.warning("Fireflies returned %d, retrying in %.1fs (%d/%d)", e.response.status_code, delay, attempt + 1, max_retries)
+            except httpx.TransportError as e:
+                if attempt == max_retries - 1:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning("Fireflies request failed (%s), retrying in %.1fs (%d/%d)", type(e).__name__, delay, attempt + 1, max_retries)
+            await asyncio.sleep(delay)
     
     async def _execute_graphql_query(self, query: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute a GraphQL query against Fireflies API.
+        With FIREFLIES_APQ_ENABLED, the query is first sent as an Automatic Persisted
+        Query (hash only) and resent in full only if the server does not know it. A server
+        without APQ support (HTTP 400 or PersistedQueryNotSupported) gets full queries from
+        then on.
         
         Args:
             query: GraphQL query string
@@ -36,178 +305,254 @@ class FirefliesClient:
         Returns:
             Response data dictionary
         """
-        payload = {"query": query}
-        if variables:
-            payload["variables"] = variables
+        if settings.FIREFLIES_APQ_ENABLED and not _APQ_UNSUPPORTED.is_set():
+            payload = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": _query_hash(query)}}}
+            if variables:
+                payload["variables"] = variables
+            try:
+                result = await self._post_with_retries(payload)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 400:
+                    raise
+                logger.info("Fireflies rejected a hash-only query (400) - sending full queries from now on")
+                _APQ_UNSUPPORTED.set()
+                result = None
+            else:
+                if _is_persisted_query_unsupported(result):
+                    logger.info("Fireflies does not support persisted queries - sending full queries from now on")
+                    _APQ_UNSUPPORTED.set()
+            if result is None or _is_persisted_query_miss(result):
+                payload["query"] = query
+                result = await self._post_with_retries(payload)
+        else:
+            payload = {"query": query}
+            if variables:
+                payload["variables"] = variables
+            result = await self._post_with_retries(payload)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.graphql_url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # Check for GraphQL errors
-            if "errors" in result:
-                error_messages = [err.get("message", str(err)) for err in result["errors"]]
-                raise Exception(f"GraphQL errors: {', '.join(error_messages)}")
-            
-            return result.get("data", {})
+        # Check for GraphQL errors (not retryable)
+        if "errors" in result:
+            error_messages = [err.get("message", str(err)) for err in result["errors"]]
+            raise Exception(f"GraphQL errors: {', '.join(error_messages)}")
+        
+        return result.get("data", {})
     
-    async def get_weekly_transcripts_list(self) -> List[Dict[str, Any]]:
+    async def get_weekly_transcripts_list(self, include_details: bool = False) -> List[Dict[str, Any]]:
         """
         Step 1: Fetch list of transcripts from the past week (basic info only).
         This gets transcript IDs which we'll use to fetch full details.
         
+        Args:
+            include_details: Also request sentences and summary in the same query
+        
         Returns:
             List of transcript dictionaries with basic info (id, title, participants, etc.)
         """
         try:
             # Calculate date range for past week
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=7)
             
             # Format dates in ISO 8601 format: YYYY-MM-DDTHH:mm.sssZ
-            from_date_str = start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-            to_date_str = end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            from_date_str = f"{start_date:%Y-%m-%dT%H:%M:%S}.000Z"
+            to_date_str = f"{end_date:%Y-%m-%dT%H:%M:%S}.000Z"
             
-            logger.info(f"Fetching transcripts list from {start_date.date()} to {end_date.date()}")
+            logger.info("Fetching transcripts list from %s to %s", start_date.date(), end_date.date())
             
-            # GraphQL query to fetch transcripts list (based on official docs)
-            query = """
-            query GetTranscriptsList($fromDate: DateTime, $toDate: DateTime, $limit: Int) {
-                transcripts(
-                    fromDate: $fromDate
-                    toDate: $toDate
-                    limit: $limit
-                ) {
-                    id
-                    title
-                    date
-                    dateString
-                    duration
-                    participants
-                    organizer_email
-                    host_email
-                    meeting_attendees {
-                        email
-                        name
-                        displayName
-                    }
-                    transcript_url
+            query = _TRANSCRIPTS_LIST_DETAILED_QUERY if include_details else _TRANSCRIPTS_LIST_QUERY
+            
+            async def fetch_page(skip: int) -> List[Dict[str, Any]]:
+                variables = {
+                    "fromDate": from_date_str,
+                    "toDate": to_date_str,
+                    "limit": _PAGE_SIZE,  # Max 50 per query
+                    "skip": skip
                 }
-            }
-            """
+                data = await self._execute_graphql_query(query, variables)
+                return data.get("transcripts") or []
             
-            variables = {
-                "fromDate": from_date_str,
-                "toDate": to_date_str,
-                "limit": 50  # Max 50 per query
-            }
+            # Paginate: while the last page was full, fetch the next _PAGE_FANOUT pages concurrently
+            page = await fetch_page(0)
+            transcripts = list(page)
+            skip = _PAGE_SIZE
+            while len(page) == _PAGE_SIZE:
+                pages = await asyncio.gather(*(fetch_page(skip + i * _PAGE_SIZE) for i in range(_PAGE_FANOUT)))
+                skip += _PAGE_FANOUT * _PAGE_SIZE
+                for page in pages:
+                    transcripts.extend(page)
+                    if len(page) < _PAGE_SIZE:
+                        break
             
-            data = await self._execute_graphql_query(query, variables)
-            transcripts = data.get("transcripts", [])
-            
-            logger.info(f"Retrieved {len(transcripts)} transcript IDs")
+            logger.info("Retrieved %d transcript IDs", len(transcripts))
             return transcripts
             
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error fetching transcripts list: {e.response.status_code} - {e.response.text}")
+            logger.error("HTTP error fetching transcripts list: %d - %s", e.response.status_code, e.response.text)
             try:
                 error_detail = e.response.json()
-                logger.error(f"Error details: {error_detail}")
-            except:
-                logger.error(f"Error response text: {e.response.text}")
+                logger.error("Error details: %s", error_detail)
+            except ValueError:
+                pass  # Body is not JSON - already logged above
             raise
-        except Exception as e:
-            logger.error(f"Error fetching transcripts list: {str(e)}")
+        except (httpx.TransportError, asyncio.TimeoutError) as e:
+            logger.error("Error fetching transcripts list: %s: %s", type(e).__name__, e)
             raise
     
     async def get_weekly_transcripts(self) -> List[Dict[str, Any]]:
         """
         Fetch all transcripts from the past week with full details.
-        This is a two-step process:
-        1. Get list of transcripts (IDs)
-        2. Fetch full details for each transcript
+        List-returning wrapper around iter_weekly_transcripts (keeps list order).
         
         Returns:
             List of complete transcript dictionaries
         """
+        indexed = [item async for item in self._iter_weekly_transcripts_indexed()]
+        indexed.sort(key=lambda item: item[0])
+        logger.info("Retrieved %d complete transcripts", len(indexed))
+        return [transcript for _, transcript in indexed]
+    
+    async def iter_weekly_transcripts(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield transcripts from the past week with full details as they become available.
+        Transcripts that arrive with the list query come first; the rest are yielded
+        as their detail fetches complete, so consumers can start processing early.
+        
+        Yields:
+            Complete transcript dictionaries (not in list order)
+        """
+        async for _, transcript in self._iter_weekly_transcripts_indexed():
+            yield transcript
+    
+    async def _iter_weekly_transcripts_indexed(self) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Details (sentences, summary) are requested on the list query itself, so
+        normally this is a single round trip. Transcripts that come back without
+        details are fetched in aliased batches of _DETAIL_BATCH_SIZE per request.
+        
+        Yields:
+            (position in the transcripts list, complete transcript dictionary)
+        """
         try:
-            # Step 1: Get list of transcripts
-            transcript_list = await self.get_weekly_transcripts_list()
+            # Step 1: Get list of transcripts with details
+            try:
+                transcript_list = await self.get_weekly_transcripts_list(include_details=True)
+            except Exception as e:
+                logger.warning("Detailed transcripts list failed (%s) - falling back to per-transcript fetches", e)
+                transcript_list = await self.get_weekly_transcripts_list()
             
             if not transcript_list:
                 logger.info("No transcripts found for the past week")
-                return []
+                return
+            
+            # Step 2: Fetch full details concurrently (bounded) for transcripts still missing them
+            semaphore = asyncio.Semaphore(settings.FIREFLIES_MAX_CONCURRENCY)
             
-            # Step 2: Fetch full details for each transcript
-            full_transcripts = []
-            for transcript_info in transcript_list:
-                transcript_id = transcript_info.get("id")
-                if transcript_id:
+            async def fetch(transcript_info: Dict[str, Any]) -> Dict[str, Any]:
+                transcript_id = transcript_info["id"]
+                async with semaphore:
                     try:
                         full_transcript = await self.get_transcript_details(transcript_id)
-                        # Merge basic info with full details
-                        full_transcript.update(transcript_info)
-                        full_transcripts.append(full_transcript)
+                        # Merge basic info with full details (detail fields win)
+                        return {**transcript_info, **full_transcript}
                     except Exception as e:
-                        logger.warning(f"Failed to fetch full transcript {transcript_id}: {str(e)}")
+                        logger.warning("Failed to fetch full transcript %s: %s", transcript_id, e)
                         # Use basic info if full fetch fails
-                        full_transcripts.append(transcript_info)
+                        return transcript_info
+            
+            async def fetch_batch(chunk: List[int]) -> Tuple[List[int], List[Dict[str, Any]]]:
+                batch = [full_transcripts[i] for i in chunk]
+                ids = [info["id"] for info in batch]
+                async with semaphore:
+                    try:
+                        details = await self._get_transcripts_details_batch(ids)
+                    except Exception as e:
+                        logger.warning("Batched fetch of %d transcripts failed (%s) - fetching individually", len(ids), e)
+                        details = None
+                if details is None:
+                    return chunk, list(await asyncio.gather(*(fetch(info) for info in batch)))
+                merged = []
+                for info, full_transcript in zip(batch, details):
+                    if full_transcript:
+                        # Merge basic info with full details (detail fields win)
+                        merged.append({**info, **full_transcript})
+                    else:
+                        merged.append(info)
+                return chunk, merged
             
-            logger.info(f"Retrieved {len(full_transcripts)} complete transcripts")
-            return full_transcripts
+            full_transcripts = [info for info in transcript_list if info.get("id")]
+            missing = []
+            for i, info in enumerate(full_transcripts):
+                if info.get("sentences") is None:
+                    missing.append(i)
+                else:
+                    yield i, info
+            if not missing:
+                return
+            
+            chunks = [missing[i:i + _DETAIL_BATCH_SIZE] for i in range(0, len(missing), _DETAIL_BATCH_SIZE)]
+            logger.info("Fetching details for %d transcripts in %d batched requests", len(missing), len(chunks))
+            tasks = [asyncio.ensure_future(fetch_batch(chunk)) for chunk in chunks]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    chunk, fetched = await next_done
+                    for i, full_transcript in zip(chunk, fetched):
+                        yield i, full_transcript
+            finally:
+                # Consumer stopped early - don't leave detail fetches running
+                for task in tasks:
+                    task.cancel()
             
         except Exception as e:
-            logger.error(f"Error fetching weekly transcripts: {str(e)}")
+            logger.error("Error fetching weekly transcripts: %s", e)
             raise
 
     async def get_transcripts_list_between(self, from_date_iso: str, to_date_iso: str, limit: int = 50):
         """
         Fetch transcripts list between provided ISO datetimes (YYYY-MM-DDTHH:MM:SS.000Z).
         Returns basic info only (ids, title, participants, etc.).
+        Results are cached for FIREFLIES_LIST_CACHE_TTL_SECONDS per (range, limit).
         """
+        cache_key = (from_date_iso, to_date_iso, limit)
+        cached = _cache_get(self._list_cache, cache_key, settings.FIREFLIES_LIST_CACHE_TTL_SECONDS)
+        if cached is not None:
+            logger.info("Retrieved %d transcripts in range (cached)", len(cached))
+            return [dict(t) for t in cached]
         try:
-            query = """
-            query GetTranscriptsList($fromDate: DateTime, $toDate: DateTime, $limit: Int) {
-                transcripts(
-                    fromDate: $fromDate
-                    toDate: $toDate
-                    limit: $limit
-                ) {
-                    id
-                    title
-                    date
-                    dateString
-                    duration
-                    participants
-                    organizer_email
-                    host_email
-                    meeting_attendees {
-                        email
-                        name
-                        displayName
-                    }
-                    transcript_url
-                }
-            }
-            """
             variables = {"fromDate": from_date_iso, "toDate": to_date_iso, "limit": limit}
-            data = await self._execute_graphql_query(query, variables)
+            data = await self._execute_graphql_query(_TRANSCRIPTS_LIST_QUERY, variables)
             transcripts = data.get("transcripts", [])
-            logger.info(f"Retrieved {len(transcripts)} transcripts in range")
+            logger.info("Retrieved %d transcripts in range", len(transcripts))
+            # Callers mutate the returned dicts - cache and hand out separate copies
+            _cache_put(self._list_cache, cache_key, [dict(t) for t in transcripts])
             return transcripts
         except Exception as e:
-            logger.error(f"Error fetching transcripts in range: {str(e)}")
+            logger.error("Error fetching transcripts in range: %s", e)
             raise
     
+    async def _get_transcripts_details_batch(self, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch complete details for several transcripts in one GraphQL request,
+        using one aliased transcript(id:) field per ID and a shared fragment.
+        
+        Args:
+            ids: Transcript IDs
+            
+        Returns:
+            Transcript dictionaries in the same order as ids (None where not found)
+        """
+        params = ", ".join(f"$id{i}: String!" for i in range(len(ids)))
+        fields = "\n".join(f"t{i}: transcript(id: $id{i}) {{ ...TFields }}" for i in range(len(ids)))
+        query = f"query GetTranscriptsBatch({params}) {{\n{fields}\n}}\n{_TRANSCRIPT_FIELDS_FRAGMENT}"
+        variables = {f"id{i}": transcript_id for i, transcript_id in enumerate(ids)}
+        data = await self._execute_graphql_query(query, variables)
+        return [data.get(f"t{i}") for i in range(len(ids))]
+    
     async def get_transcript_details(self, transcript_id: str) -> Dict[str, Any]:
         """
         Step 2: Fetch complete transcript details by ID using GraphQL.
         Based on official Fireflies API docs.
+        The weekly path gets details from the list query; this is for single-ID
+        callers and for transcripts the list query returned without details.
         
         Args:
             transcript_id: The transcript ID
@@ -215,48 +560,39 @@ class FirefliesClient:
         Returns:
             Complete transcript dictionary with sentences and all details
         """
+        cached = _cache_get(self._detail_cache, transcript_id, settings.FIREFLIES_DETAIL_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return dict(cached)
         try:
-            # GraphQL query for complete transcript (based on official docs)
-            query = """
-            query GetTranscript($transcriptId: String!) {
-                transcript(id: $transcriptId) {
-                    id
-                    title
-                    date
-                    dateString
-                    duration
-                    participants
-                    organizer_email
-                    host_email
-                    meeting_attendees {
-                        email
-                        name
-                        displayName
-                    }
-                    sentences {
-                        index
-                        speaker_name
-                        speaker_id
-                        text
-                        raw_text
-                        start_time
-                        end_time
-                    }
-                    summary {
-                        overview
-                        action_items
-                        keywords
-                    }
-                }
-            }
-            """
-            
             variables = {"transcriptId": transcript_id}
-            data = await self._execute_graphql_query(query, variables)
+            data = await self._execute_graphql_query(_TRANSCRIPT_DETAIL_QUERY, variables)
             
-            return data.get("transcript", {})
+            transcript = data.get("transcript", {})
+            if transcript:
+                # Callers merge basic info into the result - cache a separate copy
+                _cache_put(self._detail_cache, transcript_id, dict(transcript))
+            return transcript
                 
         except Exception as e:
-            logger.error(f"Error fetching transcript {transcript_id}: {str(e)}")
+            logger.error("Error fetching transcript %s: %s", transcript_id, e)
+            raise
+    
+    async def _get_transcript_details_full(self, transcript_id: str) -> Dict[str, Any]:
+        """
+        Fetch transcript details including every sentence field (index, raw_text).
+        get_transcript_details requests only the fields used downstream; use this
+        for the rare caller that needs the rest. Not cached.
+        
+        Args:
+            transcript_id: The transcript ID
+            
+        Returns:
+            Complete transcript dictionary with all sentence fields
+        """
+        try:
+            variables = {"transcriptId": transcript_id}
+            data = await self._execute_graphql_query(_TRANSCRIPT_FULL_DETAIL_QUERY, variables)
+            return data.get("transcript", {})
+        except Exception as e:
+            logger.error("Error fetching full transcript %s: %s", transcript_id, e)
             raise
-
@@ -3,16 +3,191 @@ LLM-based client identification using Groq and Agno Agent.
 """
 import logging
 import asyncio
+import json
+import random
+import re
+import threading
 from collections import defaultdict
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set
 from pydantic import BaseModel, Field
 from agno.agent import Agent
 from agno.models.groq import Groq
+from agno.run.base import RunStatus
 from agno.tools.reasoning import ReasoningTools
 from app.config import settings
+from app.services.llm_response_cache import DiskCacheBackend, InMemoryBackend, LLMResponseCache
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, single-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON decoding of raw LLM responses
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared across identifier instances so re-processing the same meetings skips the LLM
+def _build_response_cache() -> Optional[LLMResponseCache]:
+    """In-memory response cache, or a diskcache-backed one if LLM_RESPONSE_CACHE_DIR opts in."""
+    if not settings.LLM_RESPONSE_CACHE_ENABLED:
+        return None
+    if settings.LLM_RESPONSE_CACHE_DIR:
+        try:
+            return LLMResponseCache(DiskCacheBackend(settings.LLM_RESPONSE_CACHE_DIR))
+        except Exception as e:
+            logger.warning(f"Persistent LLM response cache unavailable ({e}); using in-memory cache")
+    return LLMResponseCache(InMemoryBackend(max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES))
+
+
+_RESPONSE_CACHE: Optional[LLMResponseCache] = _build_response_cache()
+
+# Shared pool for blocking agent.run() calls. Its worker count is the process-wide cap on
+# in-flight Groq requests (per-call max_concurrency only bounds a single batched run), and it
+# keeps LLM calls off the default executor used by other asyncio.to_thread work.
+# Created on first use; close_groq_executor() shuts it down.
+_GROQ_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_GROQ_EXECUTOR_LOCK = threading.Lock()
+
+
+def _groq_executor() -> ThreadPoolExecutor:
+    global _GROQ_EXECUTOR
+    with _GROQ_EXECUTOR_LOCK:
+        if _GROQ_EXECUTOR is None:
+            _GROQ_EXECUTOR = ThreadPoolExecutor(
+                max_workers=settings.GROQ_MAX_CONCURRENT_CALLS, thread_name_prefix="llm-groq"
+            )
+        return _GROQ_EXECUTOR
+
+
+async def close_groq_executor() -> None:
+    """
+    Shut down the shared Groq thread pool (call on application shutdown).
+    Queued calls are cancelled; running ones are allowed to finish.
+    A later LLM call starts a fresh pool.
+    """
+    global _GROQ_EXECUTOR
+    with _GROQ_EXECUTOR_LOCK:
+        executor, _GROQ_EXECUTOR = _GROQ_EXECUTOR, None
+    if executor is not None:
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+def _loads(content: str) -> Any:
+    """Parse a raw JSON LLM response (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Deterministic agent runs currently awaiting Groq, by request key (see _run_agent_coalesced)
+_IN_FLIGHT: Dict[str, "asyncio.Task"] = {}
+
+
+def _is_deterministic(agent: Agent) -> bool:
+    return getattr(agent.model, "temperature", None) == 0
+
+
+def _request_key(agent: Agent, prompt: str) -> str:
+    """Content address of an agent run (model, output schema, instructions, prompt)."""
+    schema = agent.output_schema
+    return LLMResponseCache.make_key(
+        agent.model.id,
+        getattr(schema, "__name__", str(schema)),
+        str(agent.instructions or ""),
+        prompt,
+    )
+
+
+def _response_cache_key(agent: Agent, prompt: str) -> Optional[str]:
+    """
+    Cache key for an agent run, or None if caching does not apply
+    (cache disabled or non-deterministic sampling).
+    """
+    if _RESPONSE_CACHE is None or not _is_deterministic(agent):
+        return None
+    return _request_key(agent, prompt)
+
+
+# Generic email providers - never a client domain
+_GENERIC_PROVIDERS = frozenset({
+    "gmail.com", "outlook.com", "hotmail.com", "yahoo.com", "icloud.com", "aol.com", "protonmail.com",
+})
+
+
+# Separators between the two parties in a meeting title (e.g., "Fruitbowl x EverMe")
+_SEP_RE = re.compile(r" (?:[xX]|<>|\||–|-) ")
+
+
+@lru_cache(maxsize=4096)
+def brand_from_title(title: str) -> Optional[str]:
+    """
+    Brand hint from a meeting title (the non-Fruitbowl side of "A x B"-style titles).
+    Shared with DataProcessor so both paths split titles the same way (leftmost separator).
+    """
+    if not title:
+        return None
+    t = title.strip()
+    sep = _SEP_RE.search(t)
+    if sep:
+        left, right = t[:sep.start()], t[sep.end():]
+        if "fruitbowl" in left.lower():
+            return right.strip().partition(":")[0]
+        return left.strip().partition(":")[0]
+    return t.partition(":")[0].strip()
+
+
+@lru_cache(maxsize=16384)
+def _domain_of_email(email: str) -> str:
+    """Lowercased domain of an email address ("" if there is no "@")."""
+    i = email.find("@")
+    if i < 0:
+        return ""
+    j = email.find("@", i + 1)  # Same part as split("@")[1] for malformed addresses
+    return email[i + 1:j if j >= 0 else None].strip().lower()
+
+
+def _domain_label(domain: Optional[str]) -> str:
+    """First DNS label of a domain, lowercased (e.g. "acme" for "acme.co.uk")."""
+    return (domain or "").split(".")[0].lower()
+
+
+def _labels_in_titles(titles: Dict[str, str], labels: Set[str]) -> Dict[str, Set[str]]:
+    """
+    Find which labels occur as substrings of each (lowercased) title.
+    With pyahocorasick, one automaton over all labels scans each title once;
+    otherwise falls back to plain `in` checks.
+
+    Args:
+        titles: Lowercased title per meeting ID
+        labels: Candidate labels (empty strings are ignored)
+
+    Returns:
+        Labels found, per meeting ID
+    """
+    labels = {lab for lab in labels if lab}
+    if ahocorasick is None or not labels:
+        return {mid: {lab for lab in labels if lab in title} for mid, title in titles.items()}
+    automaton = ahocorasick.Automaton()
+    for lab in labels:
+        automaton.add_word(lab, lab)
+    automaton.make_automaton()
+    return {mid: {lab for _, lab in automaton.iter(title)} for mid, title in titles.items()}
+
+
+@dataclass
+class MeetingFeatures:
+    """Per-meeting values derived from participant emails (computed once per identification run)."""
+    external_domains: Set[str]
+    participant_count_by_domain: Dict[str, int]
+    organizer_domain: str
+    host_domain: str
+
 
 class MeetingClientAssignment(BaseModel):
     """Client assignment for a single meeting."""
@@ -49,6 +224,117 @@ class BatchTitleAssignments(BaseModel):
     assignments: List[TitleAssignment]
 
 
+def _to_domain_batch_result(content_obj: Any, seed_domain: str) -> DomainBatchResult:
+    """
+    Normalize domain-batch agent output to a DomainBatchResult.
+    Typed agent output (the common case) is already validated and is reused as is;
+    only other models, dicts and raw JSON strings go through validation.
+    """
+    if isinstance(content_obj, DomainBatchResult):
+        return content_obj
+    if isinstance(content_obj, BatchClientAssignments):
+        return DomainBatchResult(seed_domain=seed_domain, assignments=content_obj.assignments)
+    if isinstance(content_obj, str):
+        content_obj = _loads(content_obj)
+    elif hasattr(content_obj, "model_dump"):
+        content_obj = content_obj.model_dump(exclude_none=True)
+    elif not isinstance(content_obj, dict):
+        raise ValueError("Unsupported LLM content type")
+    # Allow content to be either DomainBatchResult-like or BatchClientAssignments-like
+    if "seed_domain" in content_obj:
+        return DomainBatchResult(**content_obj)
+    # Wrap if flat
+    return DomainBatchResult(
+        seed_domain=seed_domain,
+        assignments=[MeetingClientAssignment(**a) for a in content_obj.get("assignments", [])],
+    )
+
+
+def _to_title_assignments(content_obj: Any) -> BatchTitleAssignments:
+    """Normalize title agent output to BatchTitleAssignments (typed output is reused as is)."""
+    if isinstance(content_obj, BatchTitleAssignments):
+        return content_obj
+    if isinstance(content_obj, str):
+        content_obj = _loads(content_obj)
+    elif hasattr(content_obj, "model_dump"):
+        content_obj = content_obj.model_dump(exclude_none=True)
+    elif not isinstance(content_obj, dict):
+        raise ValueError("Unsupported LLM content type for title-based mapping")
+    return BatchTitleAssignments(**content_obj)
+
+
+# Static part of the domain-batch prompt; per-batch values are appended after it
+_DOMAIN_BATCH_PROMPT_PREFIX = """You are identifying the CLIENT for a batch of meetings that all include the same seed domain (given below).
+
+Client definition:
+- The CLIENT is the company we work for (not a vendor/partner/agency).
+- Use patterns across all meetings in this batch.
+
+Exclude the internal domains listed below.
+Exclude generic providers: gmail.com, outlook.com, yahoo.com, hotmail.com, icloud.com, aol.com, protonmail.com
+
+Important acronym hints:
+- "FBD" means "Fruitbowl Digital" which is an internal team (not a client). Do NOT assign Fruitbowl/FBD as client.
+
+Instructions:
+- For EACH meeting below, decide the client domain by analyzing BOTH the title/title_brand and the external domains.
+- If seed_domain appears to be the client, choose it.
+- If another external domain is clearly the client (by title, organizer, or recurring presence), choose that.
+- If truly ambiguous, set client_domain=null and explain briefly.
+
+Return the structured output per this schema: DomainBatchResult(assignments=[MeetingClientAssignment(...)]).
+"""
+
+_DOMAIN_BATCH_PROMPT_FOOTER = """
+
+Decide client_domain for each meeting. Be consistent across the batch.
+"""
+
+# Static part of the title prompt when looking for one specific client; the target is appended
+_TITLE_TARGET_PROMPT_PREFIX = """You are identifying if meetings belong to a SPECIFIC CLIENT (the target client given below).
+
+These meetings have NO external domains, so we analyze titles to determine if they belong to the target client.
+
+Rules:
+- Analyze the title and title_brand to see if they indicate the target client.
+- If the title clearly indicates the target client (e.g., "Croffle Guys x Fruitbowl", "EverMe Team Sync", "everme weekly standup"), set client_name to the target client (or client_domain if you know it).
+- If the title does NOT indicate the target client, return nulls (do not assign).
+- Do NOT output dates/times or "Untitled" or internal-only references like "Fruitbowl" as client_name.
+- If unsure, return nulls.
+
+Important acronym hints:
+- "FBD" means "Fruitbowl Digital" (internal team). Do NOT assign as client.
+
+Separator rule for two-sided titles (like "X x Y", "X <> Y"):
+- If one side is internal (e.g., "FBD") and the other side looks like the target client, prefer the non-internal side as client_name.
+- If both sides are unclear, return nulls.
+
+Output: BatchTitleAssignments(assignments=[TitleAssignment(...)])
+"""
+
+# Title prompt when identifying all clients (fully static)
+_TITLE_GENERIC_PROMPT = """You are identifying CLIENTS from MEETING TITLES for meetings that have NO external domains.
+
+Rules:
+- Analyze the title and title_brand to determine the client.
+- If you can confidently map the brand to a domain (from week context you infer), set client_domain.
+- If no domain is available but the title clearly indicates a proper company brand (e.g., "Croffle Guys", "HME"), set client_name and leave client_domain null.
+- Do NOT output dates/times or "Untitled" or internal-only references like "Fruitbowl" as client_name.
+- If unsure, return nulls.
+
+Important acronym hints:
+- "FBD" means "Fruitbowl Digital" which is an internal team (not a client). If title contains "FBD", treat it as internal context, not a client.
+
+Separator rule for two-sided titles (like "X x Y", "X <> Y"):
+- If one side is internal (e.g., "FBD") and the other side looks like a company/brand, prefer the non-internal side as client_name.
+- If both sides are unclear brands, return nulls (do not guess).
+
+Output: BatchTitleAssignments(assignments=[TitleAssignment(...)])
+"""
+
+_TITLE_PROMPT_FOOTER = "\nReturn structured output only.\n"
+
+
 class LLMClientIdentifier:
     """Uses LLM to identify client domains from meeting data."""
     
@@ -86,24 +372,122 @@ OUTPUT REQUIREMENTS:
 Be precise and consistent. If the same client domain appears in multiple meetings, 
 assign the same domain to all related meetings."""
         )
+        # Title-mode agent, built on first use and reused across calls
+        self._title_agent: Optional[Agent] = None
+
+    def _get_title_agent(self) -> Agent:
+        """Return the shared title-extraction agent (Groq client and output schema are set up once)."""
+        if self._title_agent is None:
+            self._title_agent = Agent(
+                model=Groq(id="moonshotai/kimi-k2-instruct-0905", api_key=self.api_key, temperature=0, top_p=1),
+                output_schema=BatchTitleAssignments,
+                instructions="Extract clients from titles as per rules. Be conservative; return nulls if unsure.",
+            )
+        return self._title_agent
     
+    @staticmethod
+    async def _run_agent(agent: Agent, prompt: str):
+        """Run a blocking agent.run() on the shared Groq executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_groq_executor(), agent.run, prompt)
+
+    async def _run_agent_with_retry(self, agent: Agent, prompt: str, label: str):
+        """
+        Run an agent with a per-attempt timeout and jittered exponential backoff.
+
+        Agno catches provider errors (rate limits, connection failures) and returns a run
+        with status ERROR instead of raising, so those runs are retried like timeouts.
+        A timed-out call keeps its pool thread until Groq answers, but no longer holds up the batch.
+
+        Args:
+            agent: Agent to run
+            prompt: User prompt
+            label: Batch description for log messages
+
+        Returns:
+            The agent run output, or None if every attempt failed
+        """
+        attempts = settings.GROQ_MAX_RETRIES + 1
+        for attempt in range(attempts):
+            try:
+                result = await asyncio.wait_for(self._run_agent(agent, prompt), settings.GROQ_TIMEOUT_SECONDS)
+                if getattr(result, "status", None) != RunStatus.error:
+                    return result
+                reason = f"agent error: {getattr(result, 'content', None)}"
+            except asyncio.TimeoutError:
+                reason = f"timed out after {settings.GROQ_TIMEOUT_SECONDS}s"
+            if attempt < attempts - 1:
+                delay = min(30, 2 ** attempt) + random.uniform(0, 0.5)
+                logger.warning(f"[LLM] {label}: attempt {attempt + 1}/{attempts} {reason}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"[LLM] {label}: giving up after {attempts} attempts ({reason})")
+        return None
+
+    async def _run_agent_coalesced(self, agent: Agent, prompt: str, label: str):
+        """
+        Run an agent with retries, sharing one Groq call between identical deterministic
+        requests that are in flight at the same time (e.g. a manual run overlapping the
+        daily sync). The response cache only helps once a call has finished.
+
+        Args:
+            agent: Agent to run
+            prompt: User prompt
+            label: Batch description for log messages
+
+        Returns:
+            The agent run output, or None if every attempt failed
+        """
+        if not _is_deterministic(agent):
+            return await self._run_agent_with_retry(agent, prompt, label)
+        key = _request_key(agent, prompt)
+        loop = asyncio.get_running_loop()
+        task = _IN_FLIGHT.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._run_agent_with_retry(agent, prompt, label))
+            _IN_FLIGHT[key] = task
+
+            def _forget(done: "asyncio.Task", key: str = key) -> None:
+                if _IN_FLIGHT.get(key) is done:
+                    del _IN_FLIGHT[key]
+
+            task.add_done_callback(_forget)
+        else:
+            logger.info(f"[LLM] {label}: joining identical in-flight request")
+        # Shielded so one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
     # ===== Domain-batched mode with parallel calls =====
 
-    async def identify_clients_batched(self, meetings: List[Dict[str, Any]], internal_domains: set, max_concurrency: int = 4) -> Dict[str, MeetingClientAssignment]:
+    async def identify_clients_batched(
+        self,
+        meetings: List[Dict[str, Any]],
+        internal_domains: set,
+        max_concurrency: int = 4,
+        externals_by_id: Optional[Dict[str, Set[str]]] = None,
+    ) -> Dict[str, MeetingClientAssignment]:
         """
         Build domain-centric batches and run LLM calls in parallel (up to max_concurrency).
         Resolve overlaps by choosing assignment with highest adjusted confidence.
+        If externals_by_id is given, it is filled with each meeting's external domains
+        (so callers don't have to re-parse participants).
         """
-        domain_batches = self._build_domain_batches(meetings, internal_domains)
+        # Parse participants once; batches hold indices into meetings/features (parallel lists)
+        features = self._precompute_meeting_features(meetings, internal_domains)
+        domain_batches = self._build_domain_batches(meetings, features, externals_by_id)
         # Log detailed batch composition
         try:
             summary = {k: len(v) for k, v in domain_batches.items()}
             logger.info(f"[LLM] Domain batches built (count={len(summary)}): {summary}")
-            for seed_domain, ms in domain_batches.items():
-                ids = [m.get("id") for m in ms]
-                titles = [m.get("title", "Untitled") for m in ms]
-                logger.info(f"[LLM] Batch seed={seed_domain} meetings={len(ms)} ids={ids}")
-                logger.info(f"[LLM] Batch seed={seed_domain} titles_sample={titles[:3]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                composition = {
+                    seed_domain: {
+                        "ids": [meetings[i].get("id") for i in indices],
+                        "titles_sample": [meetings[i].get("title", "Untitled") for i in indices[:3]],
+                    }
+                    for seed_domain, indices in domain_batches.items()
+                }
+                logger.debug(f"[LLM] Batch composition: {composition}")
         except Exception:
             logger.warning("[LLM] Failed to log batch composition details")
 
@@ -111,148 +495,179 @@ assign the same domain to all related meetings."""
         total_batches = len(domain_batches)
         logger.info(f"[LLM] Processing {total_batches} domain batches with max_concurrency={max_concurrency}")
 
-        async def run_one(seed_domain: str, batch_meetings: List[Dict[str, Any]]):
-            async with semaphore:
-                logger.info(f"[LLM] Acquired semaphore for batch seed={seed_domain} (running in parallel)")
-                return await self._identify_clients_for_domain_batch_async(seed_domain, batch_meetings, internal_domains)
-
-        tasks = [run_one(d, ms) for d, ms in domain_batches.items()]
-        results: List[DomainBatchResult] = []
-        if tasks:
-            logger.info(f"[LLM] Starting {len(tasks)} parallel LLM calls (max {max_concurrency} concurrent)...")
-            results = await asyncio.gather(*tasks, return_exceptions=False)
-            logger.info(f"[LLM] All {len(results)} parallel LLM calls completed")
+        async def run_one(seed_domain: str, indices: List[int]):
+            # The semaphore is taken per LLM prompt (an oversized batch is several prompts)
+            return await self._identify_clients_for_domain_batch_async(
+                seed_domain, indices, meetings, features, internal_domains, semaphore
+            )
 
-        # Combine per-meeting best assignment with tie-breaks
+        # Combine per-meeting best assignment with tie-breaks, folding each batch in as it completes
         best: Dict[str, MeetingClientAssignment] = {}
+        best_score: Dict[str, tuple] = {}  # Score tuple of the current best[mid]
         candidates_by_meeting: Dict[str, List[MeetingClientAssignment]] = defaultdict(list)
-        meeting_map = {m.get("id"): m for m in meetings}
+        # (lowercased title, organizer domain, known labels in title) per meeting, computed once
+        # for scoring. Labels of every external domain are matched against all titles up front;
+        # a domain the LLM invents outside that set is checked against the title directly.
+        titles_lc = {m.get("id"): (m.get("title") or "").lower() for m in meetings}
+        known_labels = {_domain_label(d) for f in features for d in f.external_domains}
+        title_labels = _labels_in_titles(titles_lc, known_labels)
+        score_inputs = {
+            m.get("id"): (titles_lc[m.get("id")], f.organizer_domain, title_labels[m.get("id")])
+            for m, f in zip(meetings, features)
+        }
         domain_freq: Dict[str, int] = defaultdict(int)
-        for r in results:
-            for a in r.assignments:
-                if a.client_domain:
-                    domain_freq[a.client_domain] += 1
 
-        # Deterministic tie-breaking using lexicographic priority
-        def label(domain: str | None) -> str:
-            return (domain or "").split(".")[0].lower()
-
-        for r in results:
-            for a in r.assignments:
-                mid = a.meeting_id
-                if mid not in meeting_map:
-                    continue
-                # Track all candidates for diagnostics
-                candidates_by_meeting[mid].append(a)
-                m = meeting_map[mid]
-                title = (m.get("title") or "").lower()
-                organizer_email = m.get("organizer_email") or ""
-                organizer_domain = organizer_email.split("@")[1].lower().strip() if "@" in organizer_email else ""
-
-                d = a.client_domain or ""
-                f_title = 1 if (label(d) and label(d) in title) else 0
-                f_organizer = 1 if (d and organizer_domain == d) else 0
-                f_freq = min(1, domain_freq.get(d, 0))
-                score_tuple = (f_title, f_organizer, f_freq, d)
-
-                prev = best.get(mid)
-                if prev:
-                    prev_d = prev.client_domain or ""
-                    prev_tuple = (
-                        1 if (label(prev_d) and label(prev_d) in title) else 0,
-                        1 if (prev_d and organizer_domain == prev_d) else 0,
-                        min(1, domain_freq.get(prev_d, 0)),
-                        prev_d,
-                    )
-                else:
-                    prev_tuple = (-1, -1, -1, "")
-
-                if (not prev) or (score_tuple > prev_tuple):
-                    best[mid] = MeetingClientAssignment(
-                        meeting_id=a.meeting_id,
-                        client_domain=a.client_domain,
-                        confidence=a.confidence,  # retain original value for logs only
-                        reasoning=a.reasoning,
-                    )
+        tasks = [run_one(d, indices) for d, indices in domain_batches.items()]
+        if tasks:
+            logger.info(f"[LLM] Starting {len(tasks)} parallel LLM calls (max {max_concurrency} concurrent)...")
+            completed = 0
+            for next_done in asyncio.as_completed(tasks):
+                r: DomainBatchResult = await next_done
+                self._merge_batch_result(
+                    r, score_inputs, known_labels, best, best_score, candidates_by_meeting, domain_freq
+                )
+                completed += 1
+                logger.info(f"[LLM] Merged batch seed={r.seed_domain} ({completed}/{len(tasks)})")
+            logger.info(f"[LLM] All {completed} parallel LLM calls completed")
 
         # Diagnostics: show meetings with multiple candidate domains and the chosen one
         try:
-            for mid, cands in candidates_by_meeting.items():
-                if len(cands) > 1:
-                    chosen = best.get(mid)
-                    cand_summary = [(c.client_domain, c.confidence) for c in cands]
-                    logger.info(f"[LLM] Multi-candidate meeting {mid}: candidates={cand_summary} chosen={(chosen.client_domain if chosen else None, chosen.confidence if chosen else None)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                multi = {}
+                for mid, cands in candidates_by_meeting.items():
+                    if len(cands) > 1:
+                        chosen = best.get(mid)
+                        multi[mid] = {
+                            "candidates": [(c.client_domain, c.confidence) for c in cands],
+                            "chosen": (chosen.client_domain if chosen else None, chosen.confidence if chosen else None),
+                        }
+                if multi:
+                    logger.debug(f"[LLM] Multi-candidate meetings ({len(multi)}): {multi}")
         except Exception:
             logger.warning("[LLM] Failed to log multi-candidate diagnostics")
 
         logger.info(f"[LLM] Final per-meeting assignments: {len(best)} of {len(meetings)}")
         return best
 
+    @staticmethod
+    def _merge_batch_result(
+        r: DomainBatchResult,
+        score_inputs: Dict[str, tuple],
+        known_labels: Set[str],
+        best: Dict[str, MeetingClientAssignment],
+        best_score: Dict[str, tuple],
+        candidates_by_meeting: Dict[str, List[MeetingClientAssignment]],
+        domain_freq: Dict[str, int],
+    ) -> None:
+        """
+        Fold one batch result into the running per-meeting best assignments.
+        A candidate's own domain is counted before scoring, so the frequency
+        feature does not depend on the order batches complete in (and a stored
+        winner's score tuple never changes, so it is cached in best_score).
+        """
+        for a in r.assignments:
+            if a.client_domain:
+                domain_freq[a.client_domain] += 1
+
+        # Deterministic tie-breaking using lexicographic priority
+        for a in r.assignments:
+            mid = a.meeting_id
+            inputs = score_inputs.get(mid)
+            if inputs is None:
+                continue
+            # Track all candidates for diagnostics
+            candidates_by_meeting[mid].append(a)
+            title, organizer_domain, labels_in_title = inputs
+
+            d = a.client_domain or ""
+            lab = _domain_label(d)
+            if lab in known_labels:
+                f_title = 1 if lab in labels_in_title else 0
+            else:
+                f_title = 1 if (lab and lab in title) else 0
+            f_organizer = 1 if (d and organizer_domain == d) else 0
+            f_freq = min(1, domain_freq.get(d, 0))
+            score_tuple = (f_title, f_organizer, f_freq, d)
+
+            prev_tuple = best_score.get(mid)
+            if (prev_tuple is None) or (score_tuple > prev_tuple):
+                best_score[mid] = score_tuple
+                best[mid] = MeetingClientAssignment(
+                    meeting_id=a.meeting_id,
+                    client_domain=a.client_domain,
+                    confidence=a.confidence,  # retain original value for logs only
+                    reasoning=a.reasoning,
+                )
+
     # ===== Helpers for batched mode =====
 
-    def _extract_external_domains(self, meeting: Dict[str, Any], internal_domains: set) -> set:
-        externals = set()
-        participants = meeting.get("participants", [])
-        for p in participants:
-            if isinstance(p, str) and "@" in p:
-                domain = p.split("@")[1].lower().strip()
-                if domain and domain not in internal_domains and domain not in {
-                    "gmail.com","outlook.com","hotmail.com","yahoo.com","icloud.com","aol.com","protonmail.com"
-                }:
+    def _meeting_features(self, meeting: Dict[str, Any], internal_domains: set) -> MeetingFeatures:
+        """
+        Parse a meeting's participant, attendee, organizer and host emails in one pass.
+        A participant domain counts toward participant_count_by_domain exactly when it is external.
+        """
+        externals: Set[str] = set()
+        participant_count_by_domain: Dict[str, int] = {}
+        for p in meeting.get("participants", []):
+            if isinstance(p, str):
+                domain = _domain_of_email(p)
+                if domain and domain not in internal_domains and domain not in _GENERIC_PROVIDERS:
                     externals.add(domain)
-        attendees = meeting.get("meeting_attendees", [])
-        for a in attendees:
+                    participant_count_by_domain[domain] = participant_count_by_domain.get(domain, 0) + 1
+        for a in meeting.get("meeting_attendees", []):
             if isinstance(a, dict):
                 email = a.get("email","")
-                if email and "@" in email:
-                    domain = email.split("@")[1].lower().strip()
-                    if domain and domain not in internal_domains and domain not in {
-                        "gmail.com","outlook.com","hotmail.com","yahoo.com","icloud.com","aol.com","protonmail.com"
-                    }:
+                if email:
+                    domain = _domain_of_email(email)
+                    if domain and domain not in internal_domains and domain not in _GENERIC_PROVIDERS:
                         externals.add(domain)
+        role_domains = []
         for key in ("organizer_email","host_email"):
             email = meeting.get(key, "")
-            if email and "@" in email:
-                domain = email.split("@")[1].lower().strip()
-                if domain and domain not in internal_domains and domain not in {
-                    "gmail.com","outlook.com","hotmail.com","yahoo.com","icloud.com","aol.com","protonmail.com"
-                }:
-                    externals.add(domain)
-        return externals
-
-    def _build_domain_batches(self, meetings: List[Dict[str, Any]], internal_domains: set) -> Dict[str, List[Dict[str, Any]]]:
-        domain_to_meetings: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        for m in meetings:
-            externals = self._extract_external_domains(m, internal_domains)
-            for d in externals:
-                domain_to_meetings[d].append(m)
-        return dict(domain_to_meetings)
-
-    def _create_domain_batch_prompt(self, seed_domain: str, context_items: List[Dict[str, Any]], internal_domains: set) -> str:
-        prompt = f"""You are identifying the CLIENT for meetings that all include the domain: {seed_domain}
-
-Client definition:
-- The CLIENT is the company we work for (not a vendor/partner/agency).
-- Use patterns across all meetings in this batch.
+            domain = _domain_of_email(email) if email else ""
+            if domain and domain not in internal_domains and domain not in _GENERIC_PROVIDERS:
+                externals.add(domain)
+            role_domains.append(domain)
+        return MeetingFeatures(
+            external_domains=externals,
+            participant_count_by_domain=participant_count_by_domain,
+            organizer_domain=role_domains[0],
+            host_domain=role_domains[1],
+        )
 
-Exclude internal domains: {', '.join(sorted(internal_domains))}
-Exclude generic providers: gmail.com, outlook.com, yahoo.com, hotmail.com, icloud.com, aol.com, protonmail.com
+    def _precompute_meeting_features(self, meetings: List[Dict[str, Any]], internal_domains: set) -> List[MeetingFeatures]:
+        """Compute MeetingFeatures once per meeting (parallel to meetings)."""
+        return [self._meeting_features(m, internal_domains) for m in meetings]
 
-Important acronym hints:
-- "FBD" means "Fruitbowl Digital" which is an internal team (not a client). Do NOT assign Fruitbowl/FBD as client.
+    def _extract_external_domains(self, meeting: Dict[str, Any], internal_domains: set) -> set:
+        return self._meeting_features(meeting, internal_domains).external_domains
 
-Instructions:
-- For EACH meeting below, decide the client domain by analyzing BOTH the title/title_brand and the external domains.
-- If seed_domain appears to be the client, choose it.
-- If another external domain is clearly the client (by title, organizer, or recurring presence), choose that.
-- If truly ambiguous, set client_domain=null and explain briefly.
+    def _build_domain_batches(
+        self,
+        meetings: List[Dict[str, Any]],
+        features: List[MeetingFeatures],
+        externals_by_id: Optional[Dict[str, Set[str]]] = None,
+    ) -> Dict[str, List[int]]:
+        """Group meetings by external domain, as indices into meetings/features."""
+        domain_to_indices: Dict[str, List[int]] = defaultdict(list)
+        for i, (m, f) in enumerate(zip(meetings, features)):
+            if externals_by_id is not None:
+                externals_by_id[m.get("id")] = f.external_domains
+            for d in f.external_domains:
+                domain_to_indices[d].append(i)
+        return dict(domain_to_indices)
 
-Return the structured output per this schema: DomainBatchResult(assignments=[MeetingClientAssignment(...)]).
+    def _create_domain_batch_prompt(self, seed_domain: str, context_items: List[Dict[str, Any]], internal_domains: set) -> str:
+        # Static rules first (identical for every batch, so the provider can reuse the cached
+        # prompt prefix); everything batch-specific follows.
+        parts = [_DOMAIN_BATCH_PROMPT_PREFIX, f"""
+Seed domain: {seed_domain}
+Internal domains: {', '.join(sorted(internal_domains))}
 
 Meetings in batch:
-"""
-        for i, c in enumerate(context_items, 1):
-            prompt += f"""
+"""]
+        parts.extend(
+            f"""
 --- Meeting {i} ---
 ID: {c['meeting_id']}
 Title: {c['title']}
@@ -262,55 +677,115 @@ Participant counts: {c.get('participant_count_by_domain', {})}
 Organizer domain: {c.get('organizer_domain','')}
 Host domain: {c.get('host_domain','')}
 """
-        prompt += """
+            for i, c in enumerate(context_items, 1)
+        )
+        parts.append(_DOMAIN_BATCH_PROMPT_FOOTER)
+        return "".join(parts)
 
-Decide client_domain for each meeting. Be consistent across the batch.
-"""
-        return prompt
+    async def _identify_clients_for_domain_batch_async(
+        self,
+        seed_domain: str,
+        indices: List[int],
+        meetings: List[Dict[str, Any]],
+        features: List[MeetingFeatures],
+        internal_domains: set,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> DomainBatchResult:
+        async def run_prompt(items: List[Dict[str, Any]]) -> DomainBatchResult:
+            # Each prompt holds one slot of the caller's concurrency limit
+            if semaphore is None:
+                return await self._run_domain_batch_prompt(seed_domain, items, internal_domains)
+            async with semaphore:
+                logger.info(f"[LLM] Acquired semaphore for batch seed={seed_domain} ({len(items)} meetings)")
+                return await self._run_domain_batch_prompt(seed_domain, items, internal_domains)
 
-    async def _identify_clients_for_domain_batch_async(self, seed_domain: str, meetings: List[Dict[str, Any]], internal_domains: set) -> DomainBatchResult:
-        # Build context entries for this batch
+        # Build context entries for this batch; obvious single-domain meetings are assigned locally
+        trivial: List[MeetingClientAssignment] = []
         context_items = []
-        def _brand_from_title(title: str) -> str | None:
-            if not title:
-                return None
-            t = title.strip()
-            for sep in [" x ", " X ", " <> ", " | ", " – ", " - "]:
-                if sep in t:
-                    left, right = t.split(sep, 1)
-                    if "fruitbowl" in left.lower():
-                        return right.strip().split(":")[0]
-                    return left.strip().split(":")[0]
-            return t.split(":")[0].strip()
-        for m in meetings:
-            externals = self._extract_external_domains(m, internal_domains)
-            participant_count_by_domain = {}
-            for p in m.get("participants", []):
-                if isinstance(p, str) and "@" in p:
-                    d = p.split("@")[1].lower().strip()
-                    if d in externals:
-                        participant_count_by_domain[d] = participant_count_by_domain.get(d, 0) + 1
-            organizer_domain = ""
-            if m.get("organizer_email") and "@" in m["organizer_email"]:
-                organizer_domain = m["organizer_email"].split("@")[1].lower().strip()
-            host_domain = ""
-            if m.get("host_email") and "@" in m["host_email"]:
-                host_domain = m["host_email"].split("@")[1].lower().strip()
+        for i in indices:
+            m, f = meetings[i], features[i]
+            if settings.LLM_AUTO_ASSIGN_SINGLE_DOMAIN and self._is_single_domain_match(seed_domain, m, f):
+                trivial.append(MeetingClientAssignment(
+                    meeting_id=m["id"],
+                    client_domain=seed_domain,
+                    confidence=0.95,
+                    reasoning="single-external-domain match",
+                ))
+                continue
             context_items.append({
                 "meeting_id": m.get("id","unknown"),
                 "title": m.get("title","Untitled"),
-                "title_brand": _brand_from_title(m.get("title","")) or "",
-                "external_domains": sorted(list(externals)),
-                "participant_count_by_domain": participant_count_by_domain,
-                "organizer_domain": organizer_domain,
-                "host_domain": host_domain,
+                "title_brand": brand_from_title(m.get("title","")) or "",
+                "external_domains": sorted(f.external_domains),
+                "participant_count_by_domain": f.participant_count_by_domain,
+                "organizer_domain": f.organizer_domain,
+                "host_domain": f.host_domain,
             })
 
+        if not context_items:
+            logger.info(f"[LLM] All {len(trivial)} meetings in batch seed={seed_domain} matched locally (skipping LLM call)")
+            return DomainBatchResult(seed_domain=seed_domain, assignments=trivial)
+        if trivial:
+            logger.info(f"[LLM] Batch seed={seed_domain}: {len(trivial)} meetings matched locally, {len(context_items)} sent to LLM")
+
+        # Oversized batches are split into prompts of at most LLM_MAX_MEETINGS_PER_PROMPT meetings,
+        # chunked in meeting_id order so the same meetings always produce the same prompts
+        chunk_size = max(1, settings.LLM_MAX_MEETINGS_PER_PROMPT)
+        if len(context_items) <= chunk_size:
+            result = await run_prompt(context_items)
+            if not trivial:
+                return result
+            results = [result]
+        else:
+            context_items.sort(key=lambda c: str(c["meeting_id"]))
+            chunks = [context_items[i:i + chunk_size] for i in range(0, len(context_items), chunk_size)]
+            logger.info(f"[LLM] Splitting batch seed={seed_domain} meetings={len(context_items)} into {len(chunks)} prompts")
+            results = await asyncio.gather(*(run_prompt(chunk) for chunk in chunks))
+        reasoning = [r.batch_level_reasoning for r in results if r.batch_level_reasoning]
+        return DomainBatchResult(
+            seed_domain=seed_domain,
+            assignments=trivial + [a for r in results for a in r.assignments],
+            batch_level_reasoning="\n".join(reasoning) or None,
+        )
+
+    @staticmethod
+    def _is_single_domain_match(seed_domain: str, meeting: Dict[str, Any], features: MeetingFeatures) -> bool:
+        """
+        True if the seed is the meeting's only external domain and the title names no other party
+        (either it mentions the seed's label or it is not a two-sided "A x B"-style title).
+        """
+        if features.external_domains != {seed_domain} or not isinstance(meeting.get("id"), str):
+            return False
+        title = (meeting.get("title") or "").strip()
+        return _domain_label(seed_domain) in title.lower() or not _SEP_RE.search(title)
+
+    async def _run_domain_batch_prompt(
+        self,
+        seed_domain: str,
+        context_items: List[Dict[str, Any]],
+        internal_domains: set,
+    ) -> DomainBatchResult:
+        """
+        Run (or serve from cache) one domain-batch prompt and parse its assignments.
+
+        Args:
+            seed_domain: Domain the batch was built around
+            context_items: Per-meeting prompt context
+            internal_domains: Internal team domains
+
+        Returns:
+            Parsed batch result (empty on LLM or parse failure)
+        """
         prompt = self._create_domain_batch_prompt(seed_domain, context_items, internal_domains)
-        logger.info(f"[LLM] Starting batch seed={seed_domain} meetings={len(meetings)} prompt_chars={len(prompt)}")
+        cache_key = _response_cache_key(self.agent, prompt)
+        cached = _RESPONSE_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"[LLM] Cache hit for batch seed={seed_domain} (skipping LLM call)")
+            return DomainBatchResult.model_validate_json(cached)
+        logger.info(f"[LLM] Starting batch seed={seed_domain} meetings={len(context_items)} prompt_chars={len(prompt)}")
         # Note: We do not persist prompts to disk to avoid unintended caching beyond API transcripts.
-        # Run agent.run() in thread pool to allow parallel execution
-        result = await asyncio.to_thread(self.agent.run, prompt)
+        # Run agent.run() in the Groq thread pool to allow parallel execution
+        result = await self._run_agent_coalesced(self.agent, prompt, f"batch seed={seed_domain}")
         logger.info(f"[LLM] Completed batch seed={seed_domain}")
 
         content = getattr(result, "content", None)
@@ -318,33 +793,15 @@ Decide client_domain for each meeting. Be consistent across the batch.
             logger.warning(f"[LLM] No content for seed={seed_domain}")
             return DomainBatchResult(seed_domain=seed_domain, assignments=[], batch_level_reasoning=None)
 
-        def to_batch(content_obj) -> DomainBatchResult:
-            if hasattr(content_obj, "model_dump"):
-                data = content_obj.model_dump(exclude_none=True)
-                # Allow content to be either DomainBatchResult-like or BatchClientAssignments-like
-                if "seed_domain" in data:
-                    return DomainBatchResult(**data)
-                # Wrap if flat
-                return DomainBatchResult(seed_domain=seed_domain, assignments=[MeetingClientAssignment(**a) for a in data.get("assignments", [])])
-            if isinstance(content_obj, dict):
-                if "seed_domain" in content_obj:
-                    return DomainBatchResult(**content_obj)
-                return DomainBatchResult(seed_domain=seed_domain, assignments=[MeetingClientAssignment(**a) for a in content_obj.get("assignments", [])])
-            if isinstance(content_obj, str):
-                import json
-                parsed = json.loads(content_obj)
-                if "seed_domain" in parsed:
-                    return DomainBatchResult(**parsed)
-                return DomainBatchResult(seed_domain=seed_domain, assignments=[MeetingClientAssignment(**a) for a in parsed.get("assignments", [])])
-            raise ValueError("Unsupported LLM content type")
-
         try:
-            parsed = to_batch(content)
-            # Note: We do not persist LLM responses to disk to avoid unintended caching beyond API transcripts.
+            parsed = _to_domain_batch_result(content, seed_domain)
+            # Note: Responses only reach disk if LLM_RESPONSE_CACHE_DIR opts in to the persistent cache.
         except Exception as e:
             logger.warning(f"[LLM] Failed to parse batch response for seed={seed_domain}: {e}")
             return DomainBatchResult(seed_domain=seed_domain, assignments=[], batch_level_reasoning=None)
 
+        if cache_key:
+            _RESPONSE_CACHE.set(cache_key, parsed.model_dump_json())
         logger.info(f"[LLM] Parsed batch seed={seed_domain} assignments={len(parsed.assignments)}")
         return parsed
 
@@ -371,18 +828,6 @@ Decide client_domain for each meeting. Be consistent across the batch.
             internal_domains = set()
 
         # Build context
-        def _brand_from_title(title: str) -> str | None:
-            if not title:
-                return None
-            t = title.strip()
-            for sep in [" x ", " X ", " <> ", " | ", " – ", " - "]:
-                if sep in t:
-                    left, right = t.split(sep, 1)
-                    if "fruitbowl" in left.lower():
-                        return right.strip().split(":")[0]
-                    return left.strip().split(":")[0]
-            return t.split(":")[0].strip()
-
         context_items = []
         for m in meetings:
             title = m.get("title", "") or ""
@@ -391,59 +836,22 @@ Decide client_domain for each meeting. Be consistent across the batch.
             context_items.append({
                 "meeting_id": m.get("id", "unknown"),
                 "title": title,
-                "title_brand": _brand_from_title(title) or "",
-                "organizer_domain": (org_val.split("@")[1].lower().strip()
-                                     if "@" in org_val else ""),
-                "host_domain": (host_val.split("@")[1].lower().strip()
-                                if "@" in host_val else ""),
+                "title_brand": brand_from_title(title) or "",
+                "organizer_domain": _domain_of_email(org_val),
+                "host_domain": _domain_of_email(host_val),
             })
 
-        # Build prompt - different based on whether we're looking for a specific client or all clients
+        # Build prompt - different based on whether we're looking for a specific client or all clients.
+        # Static rules come first so the provider can reuse the cached prompt prefix.
         if target_client:
             # Option 3: Looking for specific client
-            prompt = f"""You are identifying if meetings belong to a SPECIFIC CLIENT: "{target_client}"
-
-These meetings have NO external domains, so we analyze titles to determine if they belong to "{target_client}".
-
-Rules:
-- Analyze the title and title_brand to see if they indicate "{target_client}".
-- If the title clearly indicates "{target_client}" (e.g., "Croffle Guys x Fruitbowl", "EverMe Team Sync", "everme weekly standup"), set client_name="{target_client}" (or client_domain if you know it).
-- If the title does NOT indicate "{target_client}", return nulls (do not assign).
-- Do NOT output dates/times or "Untitled" or internal-only references like "Fruitbowl" as client_name.
-- If unsure, return nulls.
-
-Important acronym hints:
-- "FBD" means "Fruitbowl Digital" (internal team). Do NOT assign as client.
-
-Separator rule for two-sided titles (like "X x Y", "X <> Y"):
-- If one side is internal (e.g., "FBD") and the other side looks like "{target_client}", prefer the non-internal side as client_name.
-- If both sides are unclear, return nulls.
-
-Output: BatchTitleAssignments(assignments=[TitleAssignment(...)])
-"""
+            parts = [_TITLE_TARGET_PROMPT_PREFIX, f'\nTarget client: "{target_client}"\n']
         else:
             # Option 1: Identify all clients generically
-            prompt = f"""You are identifying CLIENTS from MEETING TITLES for meetings that have NO external domains.
-
-Rules:
-- Analyze the title and title_brand to determine the client.
-- If you can confidently map the brand to a domain (from week context you infer), set client_domain.
-- If no domain is available but the title clearly indicates a proper company brand (e.g., "Croffle Guys", "HME"), set client_name and leave client_domain null.
-- Do NOT output dates/times or "Untitled" or internal-only references like "Fruitbowl" as client_name.
-- If unsure, return nulls.
-
-Important acronym hints:
-- "FBD" means "Fruitbowl Digital" which is an internal team (not a client). If title contains "FBD", treat it as internal context, not a client.
-
-Separator rule for two-sided titles (like "X x Y", "X <> Y"):
-- If one side is internal (e.g., "FBD") and the other side looks like a company/brand, prefer the non-internal side as client_name.
-- If both sides are unclear brands, return nulls (do not guess).
-
-Output: BatchTitleAssignments(assignments=[TitleAssignment(...)])
-"""
-        prompt += "\nMeetings:\n"
-        for i, c in enumerate(context_items, 1):
-            prompt += f"""
+            parts = [_TITLE_GENERIC_PROMPT]
+        parts.append("\nMeetings:\n")
+        parts.extend(
+            f"""
 --- Meeting {i} ---
 ID: {c['meeting_id']}
 Title: {c['title']}
@@ -451,39 +859,32 @@ Title brand: {c['title_brand']}
 Organizer domain: {c['organizer_domain']}
 Host domain: {c['host_domain']}
 """
-        prompt += "\nReturn structured output only.\n"
-
-        # Use a temporary agent with title schema
-        temp_agent = Agent(
-            model=Groq(id="moonshotai/kimi-k2-instruct-0905", api_key=self.api_key, temperature=0, top_p=1),
-            output_schema=BatchTitleAssignments,
-            instructions="Extract clients from titles as per rules. Be conservative; return nulls if unsure.",
+            for i, c in enumerate(context_items, 1)
         )
-
-        logger.info(f"[LLM-TITLE] Starting title-based batch for {len(meetings)} domainless meetings")
-        result = await asyncio.to_thread(temp_agent.run, prompt)
-        content = getattr(result, "content", None)
-        if content is None:
-            logger.warning("[LLM-TITLE] No content returned")
-            return {}
-
-        def to_batch(content_obj) -> BatchTitleAssignments:
-            if hasattr(content_obj, "model_dump"):
-                data = content_obj.model_dump(exclude_none=True)
-                return BatchTitleAssignments(**data)
-            if isinstance(content_obj, dict):
-                return BatchTitleAssignments(**content_obj)
-            if isinstance(content_obj, str):
-                import json
-                parsed = json.loads(content_obj)
-                return BatchTitleAssignments(**parsed)
-            raise ValueError("Unsupported LLM content type for title-based mapping")
-
-        try:
-            parsed = to_batch(content)
-        except Exception as e:
-            logger.warning(f"[LLM-TITLE] Failed to parse title-based response: {e}")
-            return {}
+        parts.append(_TITLE_PROMPT_FOOTER)
+        prompt = "".join(parts)
+
+        title_agent = self._get_title_agent()
+        cache_key = _response_cache_key(title_agent, prompt)
+        cached = _RESPONSE_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info(f"[LLM-TITLE] Cache hit for title-based batch of {len(meetings)} meetings (skipping LLM call)")
+            parsed = BatchTitleAssignments.model_validate_json(cached)
+        else:
+            logger.info(f"[LLM-TITLE] Starting title-based batch for {len(meetings)} domainless meetings")
+            result = await self._run_agent_coalesced(title_agent, prompt, "title-based batch")
+            content = getattr(result, "content", None)
+            if content is None:
+                logger.warning("[LLM-TITLE] No content returned")
+                return {}
+
+            try:
+                parsed = _to_title_assignments(content)
+            except Exception as e:
+                logger.warning(f"[LLM-TITLE] Failed to parse title-based response: {e}")
+                return {}
+            if cache_key:
+                _RESPONSE_CACHE.set(cache_key, parsed.model_dump_json())
 
         out: Dict[str, TitleAssignment] = {}
         for a in parsed.assignments:
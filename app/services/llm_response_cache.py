@@ -0,0 +1,161 @@
+"""
+Content-addressed cache for deterministic LLM structured outputs.
+
+Client identification runs its agents with temperature=0, so the same
+(model, schema, instructions, prompt) always yields the same answer. Responses
+are stored as the JSON of the parsed Pydantic object, keyed by a SHA-256 of
+those inputs, so re-processing the same meetings skips the LLM round trip.
+
+Backends only need get(key) -> Optional[str], set(key, value) and clear(); the
+default is a bounded in-process LRU. DiskCacheBackend (optional diskcache
+dependency) persists entries across restarts and shares them between processes.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+try:
+    import diskcache  # Optional: persistent, multi-process cache backend
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value interface for LLMResponseCache backends."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryBackend:
+    """Thread-safe bounded LRU dict (least recently used entries are evicted first)."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCacheBackend:
+    """Persistent LRU backend on a diskcache directory (safe across threads and processes)."""
+
+    def __init__(self, directory: str, size_limit_bytes: int = 256 * 1024 * 1024):
+        if diskcache is None:
+            raise ImportError("diskcache is not installed (pip install diskcache)")
+        self._cache = diskcache.Cache(
+            directory, size_limit=size_limit_bytes, eviction_policy="least-recently-used"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class LLMResponseCache:
+    """
+    Cache of serialized structured outputs keyed by the full LLM request content.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-process InMemoryBackend)
+        """
+        self.backend = backend if backend is not None else InMemoryBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_id: str, schema_name: str, instructions: str, prompt: str) -> str:
+        """
+        Build the content address for an LLM request.
+
+        Args:
+            model_id: Model identifier
+            schema_name: Name of the structured output schema
+            instructions: Agent system instructions
+            prompt: User prompt
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        return hashlib.sha256(f"{model_id}|{schema_name}|{instructions}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Serialized response JSON, or None on miss
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a serialized response.
+
+        Args:
+            key: Key from make_key()
+            value: Serialized response JSON
+        """
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached response (e.g. after changing prompts or models)."""
+        try:
+            self.backend.clear()
+        except Exception as e:
+            logger.warning(f"LLM response cache clear failed: {e}")
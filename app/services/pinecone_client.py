@@ -10,16 +10,106 @@ This service handles:
 Note: Index creation/deletion should ideally be done via CLI, but this provides
 programmatic access when needed.
 """
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+import numpy as np
+import onnxruntime
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException, PineconeApiException
 from fastembed import TextEmbedding
 
 from app.config import settings
+from app.services.embedders import l2_normalize
 
 logger = logging.getLogger(__name__)
 
 
+# FastEmbed models are loaded once per process and shared by every PineconeClient
+# (loading re-reads the ONNX model and builds a new inference session)
+_EMBEDDER_CACHE: Dict[str, TextEmbedding] = {}
+_EMBEDDER_LOCK = threading.Lock()
+# Set once a model's warmup inference has finished (see _warm_up)
+_EMBEDDER_READY: Dict[str, threading.Event] = {}
+
+# ONNX execution providers in order of preference when FASTEMBED_GPU is set
+_PREFERRED_PROVIDERS = ("CUDAExecutionProvider", "CoreMLExecutionProvider", "CPUExecutionProvider")
+
+
+def _embedding_providers() -> Optional[List[str]]:
+    """Accelerated providers available in this onnxruntime build, or None for FastEmbed's CPU default."""
+    if not settings.FASTEMBED_GPU:
+        return None
+    available = set(onnxruntime.get_available_providers())
+    providers = [p for p in _PREFERRED_PROVIDERS if p in available]
+    # Only CPU available: keep FastEmbed's default session options
+    return providers if providers[:1] != ["CPUExecutionProvider"] else None
+
+
+def _get_embedder(model_name: str) -> TextEmbedding:
+    """Return the process-wide FastEmbed model for model_name, loading it on first use."""
+    with _EMBEDDER_LOCK:
+        embedder = _EMBEDDER_CACHE.get(model_name)
+        if embedder is None:
+            providers = _embedding_providers()
+            if providers:
+                logger.info(f"FastEmbed execution providers: {providers}")
+            embedder = TextEmbedding(model_name=model_name, threads=os.cpu_count(), providers=providers)
+            _EMBEDDER_CACHE[model_name] = embedder
+            ready = _EMBEDDER_READY[model_name] = threading.Event()
+            threading.Thread(
+                target=_warm_up, args=(model_name, embedder, ready), name="fastembed-warmup", daemon=True
+            ).start()
+        return embedder
+
+
+def _warm_up(model_name: str, embedder: TextEmbedding, ready: threading.Event) -> None:
+    """Run one throwaway inference so the first real query doesn't pay ONNX session setup."""
+    try:
+        list(embedder.embed(["warmup"]))
+        logger.info(f"FastEmbed model {model_name} warmed up")
+    except Exception as e:
+        logger.warning(f"FastEmbed warmup failed for {model_name}: {e}")
+    finally:
+        ready.set()
+
+
+def _wait_for_warmup(model_name: str) -> None:
+    """Block until the model's background warmup (if any) has finished."""
+    ready = _EMBEDDER_READY.get(model_name)
+    if ready is not None:
+        ready.wait()
+
+
+# LRU of batch embeddings keyed by (model, blake2b digest of the text), shared by every
+# PineconeClient: ingest paths build a new client per run, and re-ingests and retries
+# embed the same chunks again
+_BATCH_EMBEDDING_CACHE: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+_BATCH_EMBEDDING_CACHE_MAX_ENTRIES = 10000
+_BATCH_EMBEDDING_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _text_embedding(model_name: str, text: str) -> Tuple[float, ...]:
+    """Normalized embedding of one text (cached: chat queries often repeat verbatim)."""
+    _wait_for_warmup(model_name)
+    # FastEmbed returns a generator; take its only result without building a list
+    embedding = next(iter(_get_embedder(model_name).embed([text])))
+    return tuple(l2_normalize(embedding).tolist())
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items from any iterable."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 class PineconeClient:
     """
     Pinecone client for managing indexes and data operations.
@@ -27,8 +117,14 @@ class PineconeClient:
     Compatible with Pinecone v5.4.2 API.
     """
     
-    def __init__(self):
-        """Initialize Pinecone client and FastEmbed embedder."""
+    def __init__(self, upsert_batch_size: int = 100, pool_threads: int = 30):
+        """
+        Initialize Pinecone client and FastEmbed embedder.
+        
+        Args:
+            upsert_batch_size: Vectors per upsert request; larger upserts are split and sent in parallel
+            pool_threads: Size of the index's request thread pool (parallel upsert requests)
+        """
         if not settings.PINECONE_API_KEY:
             raise ValueError("PINECONE_API_KEY must be set in environment variables")
         
@@ -38,22 +134,29 @@ class PineconeClient:
         self.metric = settings.PINECONE_METRIC
         self.cloud = settings.PINECONE_CLOUD
         self.region = settings.PINECONE_REGION
+        self.upsert_batch_size = upsert_batch_size
+        self.pool_threads = pool_threads
         
         # Initialize Pinecone client (v5.4.2 API - new format)
         self.pc = Pinecone(api_key=self.api_key)
         
-        # Initialize FastEmbed for local embeddings
-        self.embedder = TextEmbedding(model_name=settings.FASTEMBED_MODEL)
+        # FastEmbed for local embeddings (shared across clients in this process; the first
+        # client starts a background warmup, and embedding calls wait for it to finish)
+        self.embedder = _get_embedder(settings.FASTEMBED_MODEL)
         
         # Get index if it exists
         self.index = None
         if self.index_name:
             try:
-                self.index = self.pc.Index(self.index_name)
+                self.index = self._connect_index(self.index_name)
                 logger.info(f"Connected to Pinecone index: {self.index_name}")
             except Exception as e:
                 logger.warning(f"Index {self.index_name} not found or not accessible: {e}")
     
+    def _connect_index(self, name: str):
+        """Connect to an index with a thread pool for parallel (async_req) requests."""
+        return self.pc.Index(name, pool_threads=self.pool_threads)
+    
     def create_index(self, index_name: Optional[str] = None) -> bool:
         """
         Create a serverless Pinecone index without integrated embeddings.
@@ -69,13 +172,8 @@ class PineconeClient:
         if not name:
             raise ValueError("Index name must be provided or set in PINECONE_INDEX_NAME")
         
-        # Check if index already exists (v5.4.2 API)
-        existing_indexes = [idx.name for idx in self.pc.list_indexes()]
-        if name in existing_indexes:
-            logger.info(f"Index {name} already exists")
-            self.index = self.pc.Index(name)
-            return False
-        
+        # No list_indexes() pre-check (has_index() lists too in v5.4.2): an existing
+        # index is reported by create_index as 409 Conflict
         try:
             # Create serverless index (v5.4.2 API - new format)
             self.pc.create_index(
@@ -90,8 +188,15 @@ class PineconeClient:
             logger.info(f"Created Pinecone index: {name} (dimension={self.dimension}, metric={self.metric})")
             
             # Connect to the new index
-            self.index = self.pc.Index(name)
+            self.index = self._connect_index(name)
             return True
+        except PineconeApiException as e:
+            if e.status == 409:
+                logger.info(f"Index {name} already exists")
+                self.index = self._connect_index(name)
+                return False
+            logger.error(f"Failed to create index {name}: {e}")
+            raise
         except Exception as e:
             logger.error(f"Failed to create index {name}: {e}")
             raise
@@ -110,18 +215,16 @@ class PineconeClient:
         if not name:
             raise ValueError("Index name must be provided or set in PINECONE_INDEX_NAME")
         
-        # Check if index exists (v5.4.2 API)
-        existing_indexes = [idx.name for idx in self.pc.list_indexes()]
-        if name not in existing_indexes:
-            logger.info(f"Index {name} does not exist")
-            return False
-        
+        # No list_indexes() pre-check: a missing index is reported as 404 Not Found
         try:
             self.pc.delete_index(name)
             logger.info(f"Deleted Pinecone index: {name}")
             if self.index_name == name:
                 self.index = None
             return True
+        except NotFoundException:
+            logger.info(f"Index {name} does not exist")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete index {name}: {e}")
             raise
@@ -136,22 +239,54 @@ class PineconeClient:
         Returns:
             Embedding vector as list of floats
         """
-        # FastEmbed returns an iterator, get the first (and only) result
-        embedding = list(self.embedder.embed([text]))[0]
-        return embedding.tolist()
+        return list(_text_embedding(settings.FASTEMBED_MODEL, text))
     
-    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    def get_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """
         Generate embeddings for multiple texts using FastEmbed.
+        Texts seen recently are served from the embedding cache; the rest are embedded
+        in length order so each model batch pads to similar lengths. Rows are returned
+        in input order.
         
         Args:
             texts: List of texts to embed
+            batch_size: Texts per model batch
             
         Returns:
-            List of embedding vectors
+            FP32 array with one L2-normalized embedding per row. Rows can be passed to
+            Pinecone as vector values directly (the SDK converts them when serializing),
+            so no per-float Python objects are held while vectors wait to be upserted.
         """
-        embeddings = list(self.embedder.embed(texts))
-        return [emb.tolist() for emb in embeddings]
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        model_name = settings.FASTEMBED_MODEL
+        keys = [(model_name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()) for text in texts]
+        cache = _BATCH_EMBEDDING_CACHE
+        with _BATCH_EMBEDDING_CACHE_LOCK:
+            rows = [cache.get(key) for key in keys]
+            for key, row in zip(keys, rows):
+                if row is not None:
+                    cache.move_to_end(key)
+        
+        # Embed each distinct uncached text once
+        misses: Dict[Tuple[str, bytes], str] = {}
+        for key, text, row in zip(keys, texts, rows):
+            if row is None:
+                misses.setdefault(key, text)
+        if misses:
+            _wait_for_warmup(model_name)
+            miss_keys = sorted(misses, key=lambda k: len(misses[k]))
+            embeddings = l2_normalize(np.stack(list(
+                self.embedder.embed([misses[k] for k in miss_keys], batch_size=batch_size)
+            )))
+            # Copy rows so a cached row doesn't keep its whole batch array alive
+            computed = {key: row.copy() for key, row in zip(miss_keys, embeddings)}
+            with _BATCH_EMBEDDING_CACHE_LOCK:
+                cache.update(computed)
+                while len(cache) > _BATCH_EMBEDDING_CACHE_MAX_ENTRIES:
+                    cache.popitem(last=False)
+            rows = [computed[key] if row is None else row for key, row in zip(keys, rows)]
+        return np.stack(rows)
     
     def upsert_vectors(
         self,
@@ -164,7 +299,7 @@ class PineconeClient:
             vectors: List of vector dictionaries with format:
                 {
                     "id": "unique_id",
-                    "values": [0.1, 0.2, ...],  # embedding vector
+                    "values": [0.1, 0.2, ...],  # embedding vector (list or 1-D ndarray)
                     "metadata": {"key": "value"}  # optional metadata
                 }
         """
@@ -173,7 +308,17 @@ class PineconeClient:
         
         try:
             # Pinecone v5.4.2 upsert format (no namespace = default empty namespace)
-            self.index.upsert(vectors=vectors)
+            size = self.upsert_batch_size
+            if len(vectors) <= size:
+                self.index.upsert(vectors=vectors)
+            else:
+                # Send sub-batches concurrently on the index's thread pool, then wait for all
+                pending = [
+                    self.index.upsert(vectors=vectors[i:i + size], async_req=True)
+                    for i in range(0, len(vectors), size)
+                ]
+                for request in pending:
+                    request.get()
             logger.info(f"Upserted {len(vectors)} vectors")
         except Exception as e:
             logger.error(f"Failed to upsert vectors: {e}")
@@ -194,27 +339,64 @@ class PineconeClient:
                     "metadata": {"key": "value"}  # optional metadata
                 }
         """
+        self.upsert_texts_streaming(texts)
+    
+    def upsert_texts_streaming(
+        self,
+        texts: Iterable[Dict[str, Any]],
+        embed_batch: int = 64,
+        upsert_batch: Optional[int] = None,
+        max_pending: int = 4
+    ) -> int:
+        """
+        Embed and upsert texts as a pipeline (uses default empty namespace).
+        Each upsert is sent on the index's thread pool while the next batch is embedded;
+        at most max_pending upserts are in flight, so long input streams stay bounded in memory.
+        
+        Args:
+            texts: Iterable of text dictionaries (same format as upsert_texts)
+            embed_batch: Texts embedded per FastEmbed call
+            upsert_batch: Vectors per upsert request (defaults to upsert_batch_size)
+            max_pending: Max upsert requests in flight before embedding waits
+            
+        Returns:
+            Number of vectors upserted
+        """
         if not self.index:
             raise ValueError("No index connected. Create or connect to an index first.")
         
-        # Extract text content for batch embedding
-        text_contents = [item["text"] for item in texts]
+        upsert_batch = upsert_batch or self.upsert_batch_size
+        pending = deque()
+        buffer: List[Dict[str, Any]] = []
+        total = 0
         
-        # Generate embeddings in batch
-        embeddings = self.get_embeddings_batch(text_contents)
+        def send(vectors: List[Dict[str, Any]]) -> None:
+            if len(pending) >= max_pending:
+                pending.popleft().get()  # Backpressure: wait for the oldest upsert
+            pending.append(self.index.upsert(vectors=vectors, async_req=True))
         
-        # Prepare vectors for upsert
-        vectors = []
-        for i, item in enumerate(texts):
-            vector = {
-                "id": item["id"],
-                "values": embeddings[i],
-                "metadata": item.get("metadata", {})
-            }
-            vectors.append(vector)
+        try:
+            for chunk in _batched(texts, embed_batch):
+                embeddings = self.get_embeddings_batch([item["text"] for item in chunk])
+                buffer.extend(
+                    {"id": item["id"], "values": values, "metadata": item.get("metadata", {})}
+                    for item, values in zip(chunk, embeddings)
+                )
+                while len(buffer) >= upsert_batch:
+                    send(buffer[:upsert_batch])
+                    total += upsert_batch
+                    del buffer[:upsert_batch]
+            if buffer:
+                send(buffer)
+                total += len(buffer)
+            while pending:
+                pending.popleft().get()
+        except Exception as e:
+            logger.error(f"Failed to upsert texts: {e}")
+            raise
         
-        # Upsert vectors
-        self.upsert_vectors(vectors)
+        logger.info(f"Upserted {total} vectors")
+        return total
     
     def delete_vectors(
         self,
@@ -256,6 +438,40 @@ class PineconeClient:
             logger.error(f"Failed to delete by filter: {e}")
             raise
     
+    def delete_batch(
+        self,
+        ids: Optional[List[str]] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        ids_per_request: int = 1000
+    ) -> None:
+        """
+        Delete by IDs and/or metadata filters with all requests in flight at once (uses default empty namespace).
+        IDs are split into requests of at most ids_per_request (Pinecone's per-delete limit);
+        every request is sent on the index's thread pool, then all are awaited.
+        
+        Args:
+            ids: Vector IDs to delete
+            filters: Metadata filters, one delete request each
+            ids_per_request: Max IDs per delete request
+        """
+        if not self.index:
+            raise ValueError("No index connected. Create or connect to an index first.")
+        
+        ids = ids or []
+        filters = filters or []
+        try:
+            pending = [
+                self.index.delete(ids=ids[i:i + ids_per_request], async_req=True)
+                for i in range(0, len(ids), ids_per_request)
+            ]
+            pending.extend(self.index.delete(filter=f, async_req=True) for f in filters)
+            for request in pending:
+                request.get()
+            logger.info(f"Deleted {len(ids)} vectors by ID and vectors matching {len(filters)} filters")
+        except Exception as e:
+            logger.error(f"Failed to delete batch: {e}")
+            raise
+    
     def get_index_stats(self) -> Dict[str, Any]:
         """
         Get index statistics.
@@ -288,6 +504,23 @@ class PineconeClient:
             logger.error(f"Failed to list indexes: {e}")
             raise
     
+    def index_exists(self, index_name: Optional[str] = None) -> bool:
+        """
+        Check whether an index exists (stops scanning at the first match).
+        
+        Args:
+            index_name: Name of the index (uses config default if not provided)
+            
+        Returns:
+            True if the index exists
+        """
+        name = index_name or self.index_name
+        try:
+            return any(idx.name == name for idx in self.pc.list_indexes())
+        except Exception as e:
+            logger.error(f"Failed to check index {name}: {e}")
+            raise
+    
     def query(
         self,
         vector: List[float],
@@ -0,0 +1,155 @@
+"""
+Semantic answer cache for the Agno agent.
+
+Stores previously answered questions by embedding so that near-duplicate
+questions can be answered from memory instead of re-running the agent.
+Entries belong to a scope (e.g. one session on one day) and only match
+lookups made with the same scope.
+
+Embeddings are kept in two forms:
+- A 1-bit-per-dimension packed uint64 table used as a Hamming-distance prefilter
+- A full-precision FP32 table used to re-rank only the top prefilter candidates
+"""
+import logging
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Bounded in-memory cache of question embeddings -> answers.
+    Oldest entries are overwritten once max_entries is reached (ring buffer).
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        rerank_k: int = 32,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            dimension: Embedding dimension (e.g., 384 for BAAI/bge-small-en-v1.5)
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached answers
+            ttl_seconds: Seconds before a cached answer is considered stale
+            rerank_k: Number of Hamming prefilter candidates re-ranked in FP32
+        """
+        self.dimension = dimension
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.rerank_k = rerank_k
+
+        # Packed sign bits, padded up to a whole number of uint64 words
+        self._words = (dimension + 63) // 64
+        self._bits = np.zeros((max_entries, self._words), dtype=np.uint64)
+        self._vectors = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._created = np.zeros(max_entries, dtype=np.float64)
+        self._scope_ids = np.zeros(max_entries, dtype=np.int64)  # hash(scope), for vectorized filtering
+        self._scopes: List[Optional[str]] = [None] * max_entries
+        self._answers: List[Optional[str]] = [None] * max_entries
+
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def quantize(self, embedding: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Normalize an embedding and pack its sign bits.
+
+        Args:
+            embedding: Raw embedding vector
+
+        Returns:
+            Tuple of (unit-length FP32 vector, packed uint64 bit vector)
+        """
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self.dimension:
+            raise ValueError(f"Expected embedding of dimension {self.dimension}, got {vec.shape[0]}")
+        vec = vec / (np.linalg.norm(vec) + 1e-12)
+
+        signs = np.zeros(self._words * 64, dtype=bool)
+        signs[:self.dimension] = vec > 0
+        bits = np.packbits(signs).view(np.uint64)
+        return vec, bits
+
+    def add(self, embedding: Sequence[float], answer: str, scope: str = "") -> None:
+        """
+        Insert a question embedding and its answer.
+
+        Args:
+            embedding: Question embedding
+            answer: Agent answer to return on future hits
+            scope: Only lookups with the same scope can return this answer
+        """
+        vec, bits = self.quantize(embedding)
+        with self._lock:
+            slot = self._next
+            self._vectors[slot] = vec
+            self._bits[slot] = bits
+            self._created[slot] = time.monotonic()
+            self._scope_ids[slot] = hash(scope)
+            self._scopes[slot] = scope
+            self._answers[slot] = answer
+            self._next = (slot + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def lookup(self, embedding: Sequence[float], scope: str = "") -> Optional[str]:
+        """
+        Find a cached answer for a semantically equivalent question.
+
+        Args:
+            embedding: Question embedding
+            scope: Scope the answer must have been cached under
+
+        Returns:
+            Cached answer if a fresh entry meets the similarity threshold, None otherwise
+        """
+        vec, bits = self.quantize(embedding)
+        with self._lock:
+            in_scope = np.flatnonzero(self._scope_ids[:self._size] == hash(scope))
+            if in_scope.size == 0:
+                return None
+
+            # Hamming prefilter over packed sign bits
+            xor = np.bitwise_xor(self._bits[in_scope], bits)
+            hamming = np.unpackbits(xor.view(np.uint8), axis=1).sum(axis=1)
+
+            k = min(self.rerank_k, in_scope.size)
+            candidates = in_scope[np.argpartition(hamming, k - 1)[:k]]
+
+            # Exact cosine re-rank on the surviving candidates only
+            sims = self._vectors[candidates] @ vec
+            fresh = (time.monotonic() - self._created[candidates]) < self.ttl_seconds
+            sims = np.where(fresh, sims, -1.0)
+
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+
+            slot = int(candidates[best])
+            if self._scopes[slot] != scope:  # Scope hash collision
+                return None
+            logger.debug(f"Semantic cache hit (similarity={sims[best]:.4f})")
+            return self._answers[slot]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._answers = [None] * self.max_entries
+            self._scopes = [None] * self.max_entries
+            self._size = 0
+            self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -7,8 +7,9 @@ Manages session lifecycle:
 - Clean up sessions (conversation history handled by Supabase)
 """
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta
+from collections import OrderedDict
 from typing import Dict, Optional, Set
 
 from app.services.agno_agent import AgnoAgentService
@@ -22,9 +23,9 @@ class SessionManager:
     
     Each session maintains:
     - Unique session ID
-    - Agent service instance
-    - Session creation timestamp
-    - Last activity timestamp
+    - Agent service instance (created on first get_session, not at session creation)
+    - Session creation timestamp (wall clock, time.time())
+    - Last activity timestamp (time.monotonic(), immune to wall-clock jumps)
     """
     
     def __init__(self):
@@ -32,7 +33,9 @@ class SessionManager:
         Initialize session manager.
         Chat history is now handled by Supabase, so no SQLite database needed.
         """
-        self.sessions: Dict[str, Dict] = {}  # session_id -> session_data
+        # session_id -> session_data, least recently active first
+        # (get_session moves a session to the end, so cleanup only inspects the expired head)
+        self.sessions: "OrderedDict[str, Dict]" = OrderedDict()
     
     def create_session(self) -> str:
         """
@@ -43,20 +46,13 @@ class SessionManager:
         """
         session_id = str(uuid.uuid4())
         
-        # Initialize agent service for this session
-        agent_service = AgnoAgentService(
-            agent_name="Meeting Transcript Assistant",
-            model_id="openai/gpt-oss-120b",
-            enable_chat_history=True,
-            num_history_runs=2  # Reduced from 5 to 2 - prevents context overflow
-        )
-        
-        # Store session data
+        # Store session data; the agent service is built on first use, so sessions that are
+        # created and abandoned (e.g. page refreshes) never pay for it
         self.sessions[session_id] = {
             "session_id": session_id,
-            "agent_service": agent_service,
-            "created_at": datetime.utcnow(),
-            "last_activity": datetime.utcnow()
+            "agent_service": None,
+            "created_at": time.time(),
+            "last_activity": time.monotonic()
         }
         
         logger.info(f"Created new session: {session_id}")
@@ -64,7 +60,7 @@ class SessionManager:
     
     def get_session(self, session_id: str) -> Optional[AgnoAgentService]:
         """
-        Get agent service for a session.
+        Get agent service for a session, creating it on first access.
         Updates last activity timestamp.
         
         Args:
@@ -78,8 +74,22 @@ class SessionManager:
             return None
         
         # Update last activity
-        self.sessions[session_id]["last_activity"] = datetime.utcnow()
-        return self.sessions[session_id]["agent_service"]
+        session_data = self.sessions[session_id]
+        session_data["last_activity"] = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        if session_data["agent_service"] is None:
+            session_data["agent_service"] = self._create_agent_service()
+        return session_data["agent_service"]
+    
+    @staticmethod
+    def _create_agent_service() -> AgnoAgentService:
+        """Create the agent service for a session."""
+        return AgnoAgentService(
+            agent_name="Meeting Transcript Assistant",
+            model_id="openai/gpt-oss-120b",
+            enable_chat_history=True,
+            num_history_runs=2  # Reduced from 5 to 2 - prevents context overflow
+        )
     
     def session_exists(self, session_id: str) -> bool:
         """
@@ -104,13 +114,11 @@ class SessionManager:
         Returns:
             True if session was deleted, False if session didn't exist
         """
-        if session_id not in self.sessions:
+        # Remove session from memory (single lookup)
+        # Conversation history cleanup is handled by Supabase via API calls
+        if self.sessions.pop(session_id, None) is None:
             logger.info(f"Session {session_id} not found (may have been already deleted)")
             return False
-
-        # Remove session from memory
-        # Conversation history cleanup is handled by Supabase via API calls
-        del self.sessions[session_id]
         logger.info(f"Deleted session: {session_id}")
         return True
     
@@ -123,22 +131,21 @@ class SessionManager:
         Args:
             max_age_minutes: Maximum age in minutes before session is considered inactive
         """
-        now = datetime.utcnow()
-        inactive_sessions = []
-        
-        for session_id, session_data in self.sessions.items():
-            last_activity = session_data["last_activity"]
-            age_minutes = (now - last_activity).total_seconds() / 60
-            
-            if age_minutes > max_age_minutes:
-                inactive_sessions.append(session_id)
+        now = time.monotonic()
+        max_age_seconds = max_age_minutes * 60
+        cleaned = 0
         
-        for session_id in inactive_sessions:
+        # Sessions are ordered by last activity, so stop at the first one still active
+        while self.sessions:
+            session_id, session_data = next(iter(self.sessions.items()))
+            if now - session_data["last_activity"] <= max_age_seconds:
+                break
             logger.info(f"Cleaning up inactive session: {session_id}")
             self.delete_session(session_id)
+            cleaned += 1
         
-        if inactive_sessions:
-            logger.info(f"Cleaned up {len(inactive_sessions)} inactive sessions")
+        if cleaned:
+            logger.info(f"Cleaned up {cleaned} inactive sessions")
     
     def get_active_sessions_count(self) -> int:
         """
@@ -2,7 +2,10 @@
 Supabase client service for database operations and authentication.
 """
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from supabase import create_client, Client
 from app.config import settings
@@ -10,6 +13,63 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+# Recent messages per conversation (LRU), so follow-up agent turns skip the Supabase round trip.
+# SupabaseClient.add_message/delete_conversation keep it current, whichever entrypoint calls them;
+# entries expire after a TTL so writes from other worker processes are picked up.
+_HISTORY_CACHE_MAX_MESSAGES = 20
+_HISTORY_CACHE_MAX_CONVERSATIONS = 1000
+_HISTORY_CACHE_TTL_SECONDS = 300
+# conversation_id -> (monotonic time loaded, recent messages)
+_HISTORY_CACHE: "OrderedDict[str, Tuple[float, Deque[Dict[str, str]]]]" = OrderedDict()
+_HISTORY_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_history(conversation_id: str, limit: int) -> Optional[List[Dict[str, str]]]:
+    """Return up to limit cached recent messages for a conversation (oldest first), or None on a miss."""
+    with _HISTORY_CACHE_LOCK:
+        entry = _HISTORY_CACHE.get(conversation_id)
+        if entry is None:
+            return None
+        loaded_at, messages = entry
+        if time.monotonic() - loaded_at > _HISTORY_CACHE_TTL_SECONDS:
+            del _HISTORY_CACHE[conversation_id]
+            return None
+        _HISTORY_CACHE.move_to_end(conversation_id)
+        return list(messages)[-limit:]
+
+
+def store_history(conversation_id: str, messages: List[Dict[str, str]]) -> None:
+    """Cache the recent messages for a conversation, evicting the least recently used one."""
+    history = deque(
+        ({"role": m["role"], "content": m["content"]} for m in messages),
+        maxlen=_HISTORY_CACHE_MAX_MESSAGES,
+    )
+    with _HISTORY_CACHE_LOCK:
+        _HISTORY_CACHE[conversation_id] = (time.monotonic(), history)
+        _HISTORY_CACHE.move_to_end(conversation_id)
+        while len(_HISTORY_CACHE) > _HISTORY_CACHE_MAX_CONVERSATIONS:
+            _HISTORY_CACHE.popitem(last=False)
+
+
+def invalidate_history_cache(conversation_id: str) -> None:
+    """
+    Drop cached history for a conversation (e.g., after it is deleted or edited outside this client).
+    
+    Args:
+        conversation_id: Supabase conversation ID
+    """
+    with _HISTORY_CACHE_LOCK:
+        _HISTORY_CACHE.pop(conversation_id, None)
+
+
+def _append_history(conversation_id: str, role: str, content: str) -> None:
+    """Append a saved message to the cached history (uncached conversations are fetched in full later)."""
+    with _HISTORY_CACHE_LOCK:
+        entry = _HISTORY_CACHE.get(conversation_id)
+        if entry is not None:
+            entry[1].append({"role": role, "content": content})
+
+
 class SupabaseClient:
     """
     Supabase client for managing database operations and authentication.
@@ -262,6 +322,7 @@ class SupabaseClient:
                 .delete()\
                 .eq("conversation_id", conversation_id)\
                 .execute()
+            invalidate_history_cache(conversation_id)
             
             # Delete conversation
             result = self.client.table("conversations")\
@@ -301,6 +362,7 @@ class SupabaseClient:
             
             result = self.client.table("messages").insert(message_data).execute()
             if result.data:
+                _append_history(conversation_id, role, content)
                 # Update conversation updated_at
                 self.client.table("conversations")\
                     .update({"updated_at": datetime.utcnow().isoformat()})\
@@ -340,3 +402,30 @@ class SupabaseClient:
             logger.error(f"Error getting messages: {e}")
             raise
 
+    def get_recent_messages(self, conversation_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the most recent messages for a conversation, oldest first.
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Number of most recent messages to return
+            
+        Returns:
+            List of messages in chronological order
+        """
+        if not self.client:
+            raise ValueError("Supabase not configured")
+        
+        try:
+            result = self.client.table("messages")\
+                .select("role, content, created_at")\
+                .eq("conversation_id", conversation_id)\
+                .order("created_at", desc=True)\
+                .limit(limit)\
+                .execute()
+            
+            return list(reversed(result.data)) if result.data else []
+        except Exception as e:
+            logger.error(f"Error getting recent messages: {e}")
+            raise
+
@@ -13,6 +13,11 @@ from app.services.pinecone_client import PineconeClient
 from app.services.data_processor import DataProcessor
 from app.services.transcript_cleaner import TranscriptCleaner
 
+try:
+    import uvloop  # Optional (installed with uvicorn[standard]): libuv-based event loop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -123,10 +128,13 @@ def identify_clients(transcript: Dict[str, Any], data_processor: DataProcessor)
     return clients
 
 
-async def run_daily_sync_async():
+async def run_daily_sync_async(fireflies_client: FirefliesClient):
     """
     Async function that runs the actual daily sync.
     This is the core sync logic moved from main.py.
+
+    Args:
+        fireflies_client: Fireflies client owned by the caller (closed by it)
     """
     try:
         logger.info("=" * 60)
@@ -134,7 +142,6 @@ async def run_daily_sync_async():
         logger.info("=" * 60)
 
         # Initialize services
-        fireflies_client = FirefliesClient()
         pinecone_client = PineconeClient()
         data_processor = DataProcessor()
 
@@ -142,8 +149,7 @@ async def run_daily_sync_async():
         if not pinecone_client.index:
             if pinecone_client.index_name:
                 try:
-                    existing_indexes = pinecone_client.list_indexes()
-                    if pinecone_client.index_name not in existing_indexes:
+                    if not pinecone_client.index_exists():
                         logger.info(f"Index '{pinecone_client.index_name}' does not exist. Creating...")
                         pinecone_client.create_index()
                     else:
@@ -182,8 +188,7 @@ async def run_daily_sync_async():
 
                 # Fetch full transcript details for THIS transcript only
                 try:
-                    full_transcript = await fireflies_client.get_transcript_details(transcript_id)
-                    full_transcript.update(transcript_info)
+                    full_transcript = {**transcript_info, **await fireflies_client.get_transcript_details(transcript_id)}
                 except Exception as e:
                     logger.warning(f"Failed to fetch full transcript {transcript_id}: {e}")
                     continue
@@ -332,6 +337,12 @@ async def run_daily_sync_async():
         raise
 
 
+async def _run_daily_sync():
+    # One client per asyncio.run() - its connection pool is bound to that event loop
+    async with FirefliesClient() as fireflies_client:
+        await run_daily_sync_async(fireflies_client)
+
+
 @celery_app.task(name="app.tasks.daily_sync_task", bind=True)
 def daily_sync_task(self):
     """
@@ -339,8 +350,9 @@ def daily_sync_task(self):
     This runs in a separate worker process with its own memory space.
     """
     try:
-        # Run the async function
-        asyncio.run(run_daily_sync_async())
+        # Run the async function (on uvloop when available, like the API server)
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(_run_daily_sync())
         return {"status": "success", "message": "Daily sync completed"}
     except Exception as e:
         logger.error(f"Daily sync task failed: {e}", exc_info=True)
@@ -348,7 +348,6 @@ async def backfill_transcripts(total_days: int, resume: bool = False, start_date
     
     # Initialize clients
     logger.info("Initializing clients...")
-    fireflies_client = FirefliesClient()
     pinecone_client = PineconeClient()
     data_processor = DataProcessor()
     
@@ -361,8 +360,7 @@ async def backfill_transcripts(total_days: int, resume: bool = False, start_date
     logger.info(f"Using Pinecone index: {index_name}")
     
     try:
-        existing_indexes = pinecone_client.list_indexes()
-        if index_name not in existing_indexes:
+        if not pinecone_client.index_exists(index_name):
             logger.info(f"Index '{index_name}' does not exist. Creating...")
             pinecone_client.create_index(index_name)
             logger.info(f"Index '{index_name}' created successfully")
@@ -405,33 +403,34 @@ async def backfill_transcripts(total_days: int, resume: bool = False, start_date
     total_transcripts = 0
     total_chunks = 0
     
-    while current_end > target_start_date:
-        # Calculate batch start date
-        batch_start = current_end - timedelta(days=BATCH_SIZE_DAYS)
-        if batch_start < target_start_date:
-            batch_start = target_start_date
+    async with FirefliesClient() as fireflies_client:
+        while current_end > target_start_date:
+            # Calculate batch start date
+            batch_start = current_end - timedelta(days=BATCH_SIZE_DAYS)
+            if batch_start < target_start_date:
+                batch_start = target_start_date
         
-        # Process batch
-        transcripts, chunks = await process_batch(
-            fireflies_client,
-            pinecone_client,
-            data_processor,
-            batch_start,
-            current_end
-        )
+            # Process batch
+            transcripts, chunks = await process_batch(
+                fireflies_client,
+                pinecone_client,
+                data_processor,
+                batch_start,
+                current_end
+            )
         
-        total_transcripts += transcripts
-        total_chunks += chunks
+            total_transcripts += transcripts
+            total_chunks += chunks
         
-        # Save progress
-        save_progress(batch_start)
+            # Save progress
+            save_progress(batch_start)
         
-        # Move to next batch (going backwards)
-        current_end = batch_start
-        batch_num += 1
+            # Move to next batch (going backwards)
+            current_end = batch_start
+            batch_num += 1
         
-        logger.info(f"\nBatch {batch_num - 1} complete. Total: {total_transcripts} transcripts, {total_chunks} chunks")
-        logger.info(f"Remaining: {(current_end - target_start_date).days} days\n")
+            logger.info(f"\nBatch {batch_num - 1} complete. Total: {total_transcripts} transcripts, {total_chunks} chunks")
+            logger.info(f"Remaining: {(current_end - target_start_date).days} days\n")
     
     logger.info("=" * 60)
     logger.info("Backfill Complete!")
@@ -2,7 +2,7 @@
 Main FastAPI application entry point.
 Fireflies transcript processor and AI chat assistant.
 """
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from starlette.responses import StreamingResponse
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +11,7 @@ import logging
 import json
 import asyncio
 import gc
+from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
 
@@ -18,6 +19,7 @@ from typing import Optional, Dict, List, Any
 from app.config import settings
 from app.services.fireflies_client import FirefliesClient
 from app.services.data_processor import DataProcessor
+from app.services.llm_client_identifier import close_groq_executor
 from app.services.word_generator import WordGenerator
 from app.services.session_manager import SessionManager
 from app.services.supabase_client import SupabaseClient
@@ -32,11 +34,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Fireflies client (and connection pool) per process, bound to the server's event loop
+    fireflies_client = FirefliesClient()
+    app.state.fireflies = fireflies_client
+    try:
+        yield
+    finally:
+        await fireflies_client.aclose()
+        await close_groq_executor()
+
+
+def get_fireflies(request: Request) -> FirefliesClient:
+    """Dependency returning the process-wide Fireflies client created in lifespan."""
+    return request.app.state.fireflies
+
+
 # Create main app
 app = FastAPI(
     title="Fruitbowl Assistant",
     description="AI chat assistant with Fireflies transcript processing",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -150,11 +170,10 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 @app.get("/test-api")
-async def test_api():
+async def test_api(fireflies_client: FirefliesClient = Depends(get_fireflies)):
     """Debug endpoint to test Fireflies API."""
     try:
         logger.info("Testing Fireflies API connection")
-        fireflies_client = FirefliesClient()
         transcripts = await fireflies_client.get_weekly_transcripts()
         
         return {
@@ -174,12 +193,11 @@ async def test_api():
         }
 
 @app.post("/process-transcripts")
-async def process_transcripts():
+async def process_transcripts(fireflies_client: FirefliesClient = Depends(get_fireflies)):
     """Main endpoint to process Fireflies transcripts for the past week."""
     try:
         logger.info("Starting transcript processing for past week")
         
-        fireflies_client = FirefliesClient()
         data_processor = DataProcessor()
         word_generator = WordGenerator()
         
@@ -237,11 +255,13 @@ async def process_transcripts():
         )
 
 @app.post("/process-transcripts-client", response_model=ClientTranscriptsResponse)
-async def process_transcripts_client(req: ClientTranscriptsRequest):
+async def process_transcripts_client(
+    req: ClientTranscriptsRequest,
+    fireflies_client: FirefliesClient = Depends(get_fireflies)
+):
     """Process transcripts for a specific client within a date range."""
     try:
         logger.info(f"Processing client '{req.client}' from {req.start_date} to {req.end_date} (use_llm={req.use_llm})")
-        fireflies_client = FirefliesClient()
         data_processor = DataProcessor()
         word_generator = WordGenerator()
 
@@ -282,8 +302,7 @@ async def process_transcripts_client(req: ClientTranscriptsRequest):
             if transcript_id:
                 try:
                     full_transcript = await fireflies_client.get_transcript_details(transcript_id)
-                    full_transcript.update(transcript_info)
-                    full_transcripts.append(full_transcript)
+                    full_transcripts.append({**transcript_info, **full_transcript})
                 except Exception as e:
                     logger.warning(f"Failed to fetch full transcript {transcript_id}: {str(e)}")
                     full_transcripts.append(transcript_info)
@@ -352,11 +371,12 @@ async def agent_query_stream(req: AgentQueryRequest):
 
             # Query the agent with streaming (this ensures metadata is registered)
             logger.info(f"Streaming query to agent (session: {session_id}): {req.question[:100]}...")
-            full_response = ""
+            response_parts = []
 
             async for chunk in agent_service.astream_query(req.question, session_id=session_id, conversation_id=req.conversation_id):
-                full_response += chunk
+                response_parts.append(chunk)
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+            full_response = "".join(response_parts)
 
             # Save both user message and assistant response to Supabase
             if req.conversation_id and supabase_client.is_configured():
@@ -891,7 +911,7 @@ async def run_daily_sync_background():
         logger.info("=" * 60)
 
         # Initialize services
-        fireflies_client = FirefliesClient()
+        fireflies_client = app.state.fireflies
         pinecone_client = PineconeClient()
         data_processor = DataProcessor()
 
@@ -899,8 +919,7 @@ async def run_daily_sync_background():
         if not pinecone_client.index:
             if pinecone_client.index_name:
                 try:
-                    existing_indexes = pinecone_client.list_indexes()
-                    if pinecone_client.index_name not in existing_indexes:
+                    if not pinecone_client.index_exists():
                         logger.info(f"Index '{pinecone_client.index_name}' does not exist. Creating...")
                         pinecone_client.create_index()
                     else:
@@ -942,8 +961,7 @@ async def run_daily_sync_background():
 
                 # Fetch full transcript details for THIS transcript only
                 try:
-                    full_transcript = await fireflies_client.get_transcript_details(transcript_id)
-                    full_transcript.update(transcript_info)
+                    full_transcript = {**transcript_info, **await fireflies_client.get_transcript_details(transcript_id)}
                 except Exception as e:
                     logger.warning(f"Failed to fetch full transcript {transcript_id}: {e}")
                     # Skip this transcript if we can't fetch details
@@ -1239,5 +1257,5 @@ async def get_messages(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop")
 
@@ -64,8 +64,6 @@ async def test_full_pipeline():
     try:
         # Step 1: Fetch transcripts (with cache)
         print("\n[1/4] Fetching transcripts from Fireflies API...")
-        fireflies_client = FirefliesClient()
-
         # Simple cache for testing
         import os, json
         cache_dir = "cache"
@@ -76,7 +74,8 @@ async def test_full_pipeline():
             with open(cache_path, "r", encoding="utf-8") as f:
                 transcripts = json.load(f)
         else:
-            transcripts = await fireflies_client.get_weekly_transcripts()
+            async with FirefliesClient() as fireflies_client:
+                transcripts = await fireflies_client.get_weekly_transcripts()
             if transcripts:
                 os.makedirs(cache_dir, exist_ok=True)
                 with open(cache_path, "w", encoding="utf-8") as f:
@@ -247,7 +247,6 @@ async def fetch_and_store_transcripts():
     
     # Initialize clients
     logger.info("Initializing clients...")
-    fireflies_client = FirefliesClient()
     pinecone_client = PineconeClient()
     data_processor = DataProcessor()
     
@@ -299,33 +298,34 @@ async def fetch_and_store_transcripts():
             # Cache miss - fetch from API
             logger.info("Cache miss - fetching from Fireflies API...")
             
-            # Get transcript list
-            transcript_list = await fireflies_client.get_transcripts_list_between(
-                from_date_str, 
-                to_date_str,
-                limit=50
-            )
+            async with FirefliesClient() as fireflies_client:
+                # Get transcript list
+                transcript_list = await fireflies_client.get_transcripts_list_between(
+                    from_date_str, 
+                    to_date_str,
+                    limit=50
+                )
             
-            logger.info(f"Found {len(transcript_list)} transcripts")
+                logger.info(f"Found {len(transcript_list)} transcripts")
             
-            if not transcript_list:
-                logger.warning("No transcripts found in the last 10 days")
-                return
+                if not transcript_list:
+                    logger.warning("No transcripts found in the last 10 days")
+                    return
             
-            # Fetch full transcript details
-            logger.info("\nFetching full transcript details...")
-            full_transcripts = []
-            for transcript_info in transcript_list:
-                transcript_id = transcript_info.get("id")
-                if transcript_id:
-                    try:
-                        full_transcript = await fireflies_client.get_transcript_details(transcript_id)
-                        full_transcript.update(transcript_info)
-                        full_transcripts.append(full_transcript)
-                        logger.info(f"  ✓ Fetched transcript: {transcript_info.get('title', transcript_id)}")
-                    except Exception as e:
-                        logger.warning(f"  ✗ Failed to fetch transcript {transcript_id}: {e}")
-                        full_transcripts.append(transcript_info)
+                # Fetch full transcript details
+                logger.info("\nFetching full transcript details...")
+                full_transcripts = []
+                for transcript_info in transcript_list:
+                    transcript_id = transcript_info.get("id")
+                    if transcript_id:
+                        try:
+                            full_transcript = await fireflies_client.get_transcript_details(transcript_id)
+                            full_transcript.update(transcript_info)
+                            full_transcripts.append(full_transcript)
+                            logger.info(f"  ✓ Fetched transcript: {transcript_info.get('title', transcript_id)}")
+                        except Exception as e:
+                            logger.warning(f"  ✗ Failed to fetch transcript {transcript_id}: {e}")
+                            full_transcripts.append(transcript_info)
             
             # Save to cache
             save_transcripts_to_cache(full_transcripts, start_date, end_date)
@@ -62,9 +62,6 @@ async def test_transcript_retrieval(start_date: datetime, end_date: datetime, li
     logger.info(f"Today's Date: {datetime.utcnow().date()}")
     logger.info("")
     
-    # Initialize Fireflies client
-    fireflies_client = FirefliesClient()
-    
     # Format dates for API (same format as test_pinecone_setup.py)
     from_date_str, to_date_str = format_date_range(start_date, end_date)
     logger.info(f"API Request:")
@@ -76,11 +73,12 @@ async def test_transcript_retrieval(start_date: datetime, end_date: datetime, li
     try:
         # Fetch transcript list
         logger.info("Fetching transcript list from Fireflies...")
-        transcript_list = await fireflies_client.get_transcripts_list_between(
-            from_date_str,
-            to_date_str,
-            limit=limit
-        )
+        async with FirefliesClient() as fireflies_client:
+            transcript_list = await fireflies_client.get_transcripts_list_between(
+                from_date_str,
+                to_date_str,
+                limit=limit
+            )
         
         logger.info("")
         logger.info("=" * 60)